@@ -1,8 +1,7 @@
 import pandas as pd
 import sys
-import src.config as config
 from src.config import NODE_FILE, EDGE_FILE
-from src.network_model import NetworkModel
+from src.network_model import NetworkModel, CostProfile
 from src.ga_solver import GeneticSolver
 from src.rl_solver import QLearningSolver
 from src.visualizer import draw_network_path
@@ -96,23 +95,21 @@ def main():
 
         # 3. Ağırlık Ayarları
         w_d, w_r, w_res = get_weights()
-        config.W_DELAY = w_d
-        config.W_RELIABILITY = w_r
-        config.W_RESOURCE = w_res
+        profile = CostProfile(w_d, w_r, w_res)
         
         print(f"\n Parametreler: Gecikme={w_d:.2f}, Güven={w_r:.2f}, Kaynak={w_res:.2f}")
         print("-" * 40)
 
         # 4. Algoritmaları Çalıştır
         print(f" Genetik Algoritma (GA) çalışıyor...")
-        ga = GeneticSolver(network, src, dst, min_bw=bw_demand)
+        ga = GeneticSolver(network, src, dst, min_bw=bw_demand, profile=profile)
         ga_path, ga_cost, _, _ = ga.solve()
         
         print(f" Q-Learning (RL) çalışıyor (Eğitim)...")
-        rl = QLearningSolver(network, src, dst, min_bw=bw_demand)
+        rl = QLearningSolver(network, src, dst, min_bw=bw_demand, profile=profile)
         rl.train()
         rl_path = rl.get_path()
-        rl_cost_data = network.calculate_cost(rl_path)
+        rl_cost_data = network.calculate_cost(rl_path, profile)
         rl_cost = rl_cost_data['score']
 
         # 5. Sonuçları Karşılaştır ve Yazdır
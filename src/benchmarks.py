@@ -0,0 +1,378 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.network_model import NetworkModel
+from src.config import NODE_FILE, EDGE_FILE
+
+
+def write_synthetic_network(directory, n_nodes, avg_degree=10, seed=42):
+    """
+    Benchmark için data_generator ile aynı biçimde (';' ayraçlı) sentetik
+    Node/Edge CSV dosyaları üretir. 250 düğümde projedeki gibi P=0.4 yoğunluğu
+    kullanılır, daha büyük ağlarda ortalama derece sabit tutulur.
+
+    Dönüş: (node_file, edge_file)
+    """
+    rng = np.random.default_rng(seed)
+    if n_nodes <= 250:
+        avg_degree = 0.4 * (n_nodes - 1)
+    n_edges = int(n_nodes * avg_degree / 2)
+
+    # Rastgele uç çiftleri (döngüsüz, tekrarsız)
+    u = rng.integers(0, n_nodes, size=int(n_edges * 1.2) + 10)
+    v = rng.integers(0, n_nodes, size=u.size)
+    keep = u != v
+    a, b = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+    _, first = np.unique(a * n_nodes + b, return_index=True)
+    first = np.sort(first)[:n_edges]
+    a, b = a[first], b[first]
+
+    node_file = os.path.join(directory, f'NodeData_{n_nodes}.csv')
+    edge_file = os.path.join(directory, f'EdgeData_{n_nodes}.csv')
+
+    pd.DataFrame({
+        'node_id': np.arange(n_nodes),
+        's_ms': np.round(rng.uniform(0.5, 2.0, n_nodes), 2),
+        'r_node': np.round(rng.uniform(0.95, 0.999, n_nodes), 4),
+    }).to_csv(node_file, sep=';', index=False)
+
+    pd.DataFrame({
+        'src': a,
+        'dst': b,
+        'capacity_mbps': rng.integers(100, 1001, a.size),
+        'delay_ms': rng.integers(3, 16, a.size),
+        'r_link': np.round(rng.uniform(0.95, 0.999, a.size), 4),
+    }).to_csv(edge_file, sep=';', index=False)
+
+    return node_file, edge_file
+
+
+def _legacy_load(node_file, edge_file):
+    """Eski (satır satır iterrows) yükleyici; karşılaştırma için."""
+    graph = nx.Graph()
+    nodes_df = pd.read_csv(node_file, delimiter=';')
+    edges_df = pd.read_csv(edge_file, delimiter=';')
+
+    nodes_df['s_ms'] = nodes_df['s_ms'].astype(str).str.replace(',', '.').astype(float)
+    nodes_df['r_node'] = nodes_df['r_node'].astype(str).str.replace(',', '.').astype(float)
+    edges_df['r_link'] = edges_df['r_link'].astype(str).str.replace(',', '.').astype(float)
+
+    for _, row in nodes_df.iterrows():
+        graph.add_node(int(row['node_id']), proc_delay=row['s_ms'], reliability=row['r_node'])
+    for _, row in edges_df.iterrows():
+        graph.add_edge(int(row['src']), int(row['dst']),
+                       bandwidth=row['capacity_mbps'],
+                       link_delay=row['delay_ms'],
+                       reliability=row['r_link'])
+    return graph
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def bench_load(sizes=(250, 10_000, 100_000), avg_degree=10, legacy_limit=10_000):
+    """
+    NetworkModel.load_data yükleme süresini ölçer.
+
+    Her boyut için:
+    - legacy: eski iterrows yükleyici (legacy_limit'ten büyük ağlarda atlanır)
+    - cold:   CSV ayrıştırma + dizi/CSR kurulumu + önbellek yazma
+    - warm:   önbellekten okuma + dizi/CSR kurulumu
+    - graph:  nx grafının ilk erişimde kurulumu (sadece GUI/görselleştirme öder)
+    """
+    print(f"{'Düğüm':>8} | {'Kenar':>9} | {'Legacy (ms)':>12} | {'Cold (ms)':>10} | "
+          f"{'Warm (ms)':>10} | {'Graph (ms)':>10}")
+    print("-" * 75)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            node_file, edge_file = write_synthetic_network(tmp, n, avg_degree)
+
+            legacy_ms = None
+            if n <= legacy_limit:
+                _, legacy_ms = _timed(lambda: _legacy_load(node_file, edge_file))
+
+            model, cold_ms = _timed(lambda: NetworkModel(node_file, edge_file))
+            model, warm_ms = _timed(lambda: NetworkModel(node_file, edge_file))
+            _, graph_ms = _timed(lambda: model.graph)
+
+            legacy_txt = f"{legacy_ms:12.1f}" if legacy_ms is not None else f"{'-':>12}"
+            print(f"{n:>8} | {model.graph.number_of_edges():>9} | {legacy_txt} | "
+                  f"{cold_ms:10.1f} | {warm_ms:10.1f} | {graph_ms:10.1f}")
+
+
+def bench_mutation(src=98, dst=216, min_bw=50, samples=2000, seed=42):
+    """
+    GA mutasyon yaması (ara düğüm -> dst yolu) başına gecikmeyi ölçer.
+
+    - legacy:  filtrelenmiş subgraph_view üzerinde her seferinde nx.shortest_path
+    - tree:    dst kökenli next-hop ağacında işaretçi takibi (ağaç kurulumu dahil değil)
+    """
+    from src.ga_solver import GeneticSolver
+
+    model = NetworkModel(NODE_FILE, EDGE_FILE)
+    rng = random.Random(seed)
+    view = nx.subgraph_view(model.graph,
+                            filter_edge=lambda u, v: model.graph[u][v]['bandwidth'] >= min_bw)
+    starts = [rng.randrange(model.get_csr().num_nodes) for _ in range(samples)]
+
+    def legacy():
+        for u in starts:
+            try:
+                nx.shortest_path(view, u, dst)
+            except nx.NetworkXNoPath:
+                pass
+
+    for weighted in (False, True):
+        model._next_hop_trees.clear()
+        solver, build_ms = _timed(lambda: GeneticSolver(model, src, dst, min_bw,
+                                                        weighted_repair=weighted))
+        _, tree_ms = _timed(lambda: [solver.path_to_dst(u) for u in starts])
+        label = 'tree (cost)' if weighted else 'tree (hops)'
+        print(f"{label:<12}: {tree_ms * 1000 / samples:8.2f} µs/mutasyon "
+              f"(ağaç kurulumu {build_ms:.2f} ms)")
+
+    _, legacy_ms = _timed(legacy)
+    print(f"{'legacy':<12}: {legacy_ms * 1000 / samples:8.2f} µs/mutasyon")
+
+
+def _legacy_q_train(model, src, dst, min_bw, episodes):
+    """
+    Eski (sözlük tabanlı Q-Tablosu) eğitim döngüsü; karşılaştırma için.
+    İlerleme ölçümleri (her 100 bölümde get_path + calculate_cost) dahildir.
+    Dönüş: toplam adım sayısı
+    """
+    from src.config import RL_ALPHA, RL_GAMMA, RL_EPSILON
+
+    csr = model.get_csr(min_bw)
+    adj = csr.neighbor_lists()
+    step_costs = model.get_step_costs(csr).tolist()
+    q_table = {}
+
+    def get_path():
+        state, path, visited = src, [src], {src}
+        while state != dst and len(path) <= 100:
+            neighbors = [n for n in adj[state] if n not in visited]
+            if not neighbors: break
+            qs = [q_table.get((state, n), 0.0) for n in neighbors]
+            state = neighbors[qs.index(max(qs))]
+            path.append(state)
+            visited.add(state)
+        return path
+
+    total_steps = 0
+    for episode in range(episodes):
+        state, cost, steps = src, 0, 0
+        while state != dst and steps < 50:
+            neighbors = adj[state]
+            if not neighbors: break
+            if random.random() < RL_EPSILON:
+                k = random.randrange(len(neighbors))
+            else:
+                qs = [q_table.get((state, n), 0.0) for n in neighbors]
+                max_q = max(qs)
+                k = random.choice([i for i, q in enumerate(qs) if q == max_q])
+            action = neighbors[k]
+            cost += step_costs[csr.indptr[state] + k]
+            reward = (1000.0 / cost if cost > 0 else 1000.0) if action == dst else -0.1
+            old_q = q_table.get((state, action), 0.0)
+            next_max = max([q_table.get((action, n), 0.0) for n in adj[action]], default=0)
+            q_table[(state, action)] = old_q + RL_ALPHA * (reward + RL_GAMMA * next_max - old_q)
+            state = action
+            steps += 1
+        total_steps += steps
+        if episode % 100 == 0:
+            model.calculate_cost(get_path())
+    return total_steps
+
+
+def bench_rl(demands=((98, 216, 50), (5, 100, 200), (17, 42, 500)), seed=42):
+    """
+    Q-Learning eğitim hızını (adım/saniye) ölçer.
+
+    - legacy: sözlük tabanlı Q-Tablosu (komşu başına dict araması)
+    - dense:  CSR yuvası başına yoğun NumPy Q dizisi (QLearningSolver.train)
+    """
+    from src.config import RL_EPISODES
+    from src.rl_solver import QLearningSolver
+
+    model = NetworkModel(NODE_FILE, EDGE_FILE)
+    print(f"{'Talep':>16} | {'Legacy (adım/s)':>16} | {'Dense (adım/s)':>15} | {'Hızlanma':>8}")
+    print("-" * 66)
+    for src, dst, bw in demands:
+        random.seed(seed)
+        steps, legacy_ms = _timed(lambda: _legacy_q_train(model, src, dst, bw, RL_EPISODES))
+        legacy_rate = steps / legacy_ms * 1000
+
+        random.seed(seed)
+        solver = QLearningSolver(model, src, dst, bw)
+        _, dense_ms = _timed(solver.train)
+        dense_rate = solver.stats['steps'] / dense_ms * 1000
+
+        print(f"{f'{src}->{dst} ({bw})':>16} | {legacy_rate:16.0f} | {dense_rate:15.0f} | "
+              f"{dense_rate / legacy_rate:7.1f}x")
+
+
+def bench_rl_batched(demands=((98, 216, 50), (5, 100, 200), (17, 42, 500)),
+                     batch_sizes=(1, 16, 64, 256), seed=42):
+    """
+    Toplu (lockstep) Q-Learning eğitimini sıralı train() ile karşılaştırır.
+
+    Her talep ve yığın boyutu için adım/saniye ve bulunan yolun maliyeti
+    (Dijkstra optimumuna göre) raporlanır.
+    """
+    from src.dijkstra_solver import DijkstraSolver
+    from src.rl_solver import QLearningSolver
+
+    model = NetworkModel(NODE_FILE, EDGE_FILE)
+    print(f"{'Talep':>16} | {'Mod':>8} | {'Adım/s':>9} | {'Süre (ms)':>9} | {'Maliyet':>8} | {'Optimum':>8}")
+    print("-" * 74)
+    for src, dst, bw in demands:
+        _, optimum = DijkstraSolver(model, src, dst, bw).solve()
+        for batch in (None,) + tuple(batch_sizes):
+            random.seed(seed)
+            solver = QLearningSolver(model, src, dst, bw)
+            if batch is None:
+                _, ms = _timed(solver.train)
+            else:
+                _, ms = _timed(lambda: solver.train_batched(batch))
+            path = solver.get_path()
+            cost = model.calculate_cost(path)['score'] if path and path[-1] == dst else float('inf')
+            label = 'sıralı' if batch is None else f'B={batch}'
+            print(f"{f'{src}->{dst} ({bw})':>16} | {label:>8} | "
+                  f"{solver.stats['steps'] / ms * 1000:9.0f} | {ms:9.1f} | {cost:8.3f} | {optimum:8.3f}")
+
+
+def bench_rl_init(demands=((98, 216, 50), (5, 100, 200), (17, 42, 500)), seeds=(0, 1, 2)):
+    """
+    Q-Tablosu başlatma modlarını karşılaştırır (varsayılan erken durdurma ile).
+
+    - yakınsama: açgözlü yolun son kez değiştiği ölçümün bölümü
+    - bölüm:     erken durdurmayla fiilen çalıştırılan bölüm sayısı
+    - maliyet:   bulunan yolun maliyeti (Dijkstra optimumuna göre sapma)
+    """
+    from src.dijkstra_solver import DijkstraSolver
+    from src.rl_solver import QLearningSolver
+
+    modes = {
+        'zero': {},
+        'heuristic': {'q_init': 'heuristic'},
+        'shaping': {'shaping': True},
+        'heur+shape': {'q_init': 'heuristic', 'shaping': True},
+    }
+    model = NetworkModel(NODE_FILE, EDGE_FILE)
+    print(f"{'Mod':>10} | {'Yakınsama':>9} | {'Bölüm':>6} | {'Süre (ms)':>9} | {'Sapma (%)':>9}")
+    print("-" * 56)
+    for name, kwargs in modes.items():
+        converged, episodes, times, gaps = [], [], [], []
+        for src, dst, bw in demands:
+            _, optimum = DijkstraSolver(model, src, dst, bw).solve()
+            for seed in seeds:
+                random.seed(seed)
+                start = time.perf_counter()
+                solver = QLearningSolver(model, src, dst, bw, **kwargs)
+                history = solver.train()
+                times.append((time.perf_counter() - start) * 1000)
+                changes = [i for i in range(1, len(history)) if history[i] != history[i - 1]]
+                converged.append(changes[-1] * 100 + 1 if changes else 1)
+                episodes.append(solver.stats['episodes'])
+                path = solver.get_path()
+                cost = model.calculate_cost(path)['score'] if path[-1] == dst else float('inf')
+                gaps.append((cost - optimum) / optimum * 100)
+        print(f"{name:>10} | {np.mean(converged):9.0f} | {np.mean(episodes):6.0f} | "
+              f"{np.mean(times):9.1f} | {np.mean(gaps):9.1f}")
+
+
+def bench_rl_mask(bandwidths=(0, 900, 980), pairs=10, seeds=(0, 1), seed=5):
+    """
+    Eylem maskesinin (ziyaret edilmemiş + dst'ye ulaşabilen komşular) etkisini ölçer.
+
+    Her BW filtresi için yolu olan rastgele (src, dst) çiftlerinde, tam
+    uzunlukta (erken durdurmasız) eğitimle: faydalı (dst'ye ulaşan) bölüm
+    başına adım, faydalı bölüm oranı, süre ve optimuma göre sapma.
+    """
+    from src.dijkstra_solver import DijkstraSolver
+    from src.rl_solver import QLearningSolver
+
+    model = NetworkModel(NODE_FILE, EDGE_FILE)
+    rng = random.Random(seed)
+    print(f"{'BW':>5} | {'Mod':>5} | {'Adım/faydalı':>12} | {'Faydalı (%)':>11} | {'Süre (ms)':>9} | {'Sapma (%)':>9}")
+    print("-" * 68)
+    for bw in bandwidths:
+        demands = []
+        while len(demands) < pairs:
+            src, dst = rng.randrange(model.get_csr().num_nodes), rng.randrange(model.get_csr().num_nodes)
+            path, optimum = DijkstraSolver(model, src, dst, bw).solve()
+            if src != dst and path:
+                demands.append((src, dst, optimum))
+        for mask in (False, True):
+            per_useful, useful, times, gaps = [], [], [], []
+            for src, dst, optimum in demands:
+                for s in seeds:
+                    random.seed(s)
+                    solver = QLearningSolver(model, src, dst, bw, action_mask=mask)
+                    _, ms = _timed(lambda: solver.train(q_tolerance=0))
+                    stats = solver.stats
+                    per_useful.append(stats['steps'] / max(stats['useful_episodes'], 1))
+                    useful.append(stats['useful_episodes'] / stats['episodes'] * 100)
+                    times.append(ms)
+                    path = solver.get_path()
+                    cost = model.calculate_cost(path)['score'] if path[-1] == dst else float('inf')
+                    gaps.append((cost - optimum) / optimum * 100)
+            print(f"{bw:>5} | {'maske' if mask else 'yok':>5} | {np.mean(per_useful):12.2f} | "
+                  f"{np.mean(useful):11.1f} | {np.mean(times):9.1f} | {np.mean(gaps):9.1f}")
+
+
+def bench_experiments(worker_counts=None):
+    """
+    run_experiments'ın seri ve süreç paralel modlarının duvar süresini
+    karşılaştırır (aynı tohumlar; sonuçlar geçici Excel dosyalarına yazılır).
+    """
+    from src.run_experiments import run_experiments
+
+    cpus = os.cpu_count() or 1
+    worker_counts = worker_counts or sorted({1, 2, cpus})
+    walls = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in worker_counts:
+            walls[workers] = run_experiments(workers=workers,
+                                             excel_file=os.path.join(tmp, f'sonuc_{workers}.xlsx'))
+
+    print(f"\n{'Worker':>6} | {'Duvar (s)':>9} | {'Hızlanma':>8}   (CPU: {cpus})")
+    print("-" * 32)
+    for workers, wall in walls.items():
+        print(f"{workers:>6} | {wall:9.1f} | {walls[worker_counts[0]] / wall:7.2f}x")
+
+
+BENCHMARKS = {
+    'load': bench_load,
+    'mutation': bench_mutation,
+    'rl': bench_rl,
+    'rl_batched': bench_rl_batched,
+    'rl_init': bench_rl_init,
+    'rl_mask': bench_rl_mask,
+    'experiments': bench_experiments,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BSM307 performans ölçümleri")
+    parser.add_argument('names', nargs='*', default=list(BENCHMARKS),
+                        help=f"Çalıştırılacak ölçümler: {', '.join(BENCHMARKS)}")
+    args = parser.parse_args()
+
+    for name in args.names:
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name]()
@@ -4,19 +4,54 @@ EDGE_FILE = 'data/BSM307_317_Guz2025_TermProject_EdgeData.csv'
 DEMAND_FILE = 'data/BSM307_317_Guz2025_TermProject_DemandData.csv'
 
 # Optimizasyon Ağırlıkları (Varsayılan Değerler)
-# Bu değerler GUI üzerinden değiştirilebilir.
+# GUI ve main.py farklı ağırlıkları bu değişkenleri değiştirerek değil,
+# CostProfile (network_model.py) nesnesiyle çözücülere aktarır.
 # Toplamları daima 1.0 olmalıdır.
 W_DELAY = 0.33       # Gecikme Ağırlığı
 W_RELIABILITY = 0.33 # Güvenilirlik Ağırlığı
 W_RESOURCE = 0.34    # Kaynak Kullanımı Ağırlığı
 
+# Ağırlık üçlüsü başına önbellekte tutulan maliyet tablosu sayısı (LRU)
+COST_TABLE_CACHE_SIZE = 8
+
+# Bant genişliği eşiği başına önbellekte tutulan filtrelenmiş graf sayısı (LRU)
+FILTER_CACHE_SIZE = 8
+
+# Hedef başına önbellekte tutulan next-hop (ters en kısa yol) ağacı sayısı (LRU)
+NEXT_HOP_CACHE_SIZE = 32
+
+# Rota tablosu (tüm çiftler için önceden hesaplanmış rotalar) BW sınıfları (Mbps)
+# DemandData'daki talepler: 50 / 100 / 200 / 500
+ROUTE_TABLE_BW_CLASSES = (0, 50, 100, 200, 500)
+
 # Genetik Algoritma (GA) Parametreleri
 GA_POP_SIZE = 30       # Popülasyon Büyüklüğü (Birey Sayısı)
 GA_GENERATIONS = 50    # Jenerasyon (Nesil) Sayısı
 GA_MUTATION_RATE = 0.1 # Mutasyon (Değişim) Olasılığı
+GA_WEIGHTED_REPAIR = False # Mutasyon yaması: False -> en az atlama, True -> en düşük ağırlıklı maliyet
+GA_INIT_BIAS = 0.0         # Başlangıç yürüyüşlerinde kalan maliyeti düşük komşulara yönelim (0 -> tekdüze)
+GA_STALL_GENERATIONS = 20  # Bu kadar nesil iyileşme olmazsa erken dur (None -> her zaman GA_GENERATIONS)
+GA_STALL_EPSILON = 1e-4    # "İyileşme" sayılan en küçük göreli maliyet düşüşü
+GA_FITNESS_CACHE_SIZE = 10000  # Çözüm başına önbellekte tutulan yol maliyeti sayısı (LRU)
+GA_DEDUPLICATE = False     # Tekrarlanan yolları yeni rastgele bireylerle değiştir
+GA_WARM_START_SIZE = 32    # Sıcak başlatma deposunda tutulan (src, dst) popülasyonu sayısı (LRU)
+
+# Ada (Island) Modeli - GeneticSolver.solve_islands
+GA_ISLANDS = 4              # Alt popülasyon (ada) sayısı; her biri GA_POP_SIZE bireyli
+GA_MIGRATION_INTERVAL = 10  # Kaç nesilde bir göç yapılacağı
+GA_MIGRANTS = 2             # Her göçte bir sonraki adaya gönderilen en iyi birey sayısı
 
 # Pekiştirmeli Öğrenme (RL - Q-Learning) Parametreleri
 RL_EPISODES = 3000     # Eğitim Tur Sayısı (250 düğümlü ağ için artırıldı)
 RL_ALPHA = 0.1         # Öğrenme Hızı (Learning Rate - Yeni bilgiye ne kadar değer verileceği)
 RL_GAMMA = 0.9         # Gelecek İskonto Katsayısı (Discount Factor - Gelecekteki ödülün önemi)
-RL_EPSILON = 0.1       # Keşfetme Oranı (Exploration Rate - Rastgele hareket ihtimali)
\ No newline at end of file
+RL_EPSILON = 0.1       # Keşfetme Oranı (Exploration Rate - Rastgele hareket ihtimali)
+RL_BATCH_SIZE = 64     # train_batched: aynı anda (lockstep) ilerleyen ajan sayısı
+RL_CACHE_SIZE = 16     # QTableCache: bellekte tutulan en fazla Q-Tablosu (hedef, BW, profil) sayısı
+RL_WARM_EPISODES = 300 # Önbellekten devralınan tabloyla kısa eğitim bölümü (0 -> eğitimi atla)
+RL_CACHE_ANY_SOURCE = False  # Farklı kaynaktan gelen sorgu da aynı hedefin tablosunu devralsın mı
+RL_STABLE_PROBES = 0   # Açgözlü yol bu kadar ölçüm (x100 bölüm) değişmezse eğitimi durdur (0 -> kapalı)
+RL_Q_TOLERANCE = 1e-3  # Yol üzerindeki Q değerlerinin ölçümler arası göreli değişimi bunun altındaysa dur (0 -> kapalı)
+RL_Q_INIT = 'zero'     # Q-Tablosu başlangıcı: 'zero' veya 'heuristic' (en kısa yol maliyetlerinden)
+RL_SHAPING = False     # Potansiyel tabanlı ödül şekillendirme (Φ = sezgisel durum değeri)
+RL_ACTION_MASK = False # Eğitimde sadece ziyaret edilmemiş ve dst'ye ulaşabilen komşular seçilir
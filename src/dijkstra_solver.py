@@ -0,0 +1,97 @@
+import heapq
+from src.network_model import CostProfile
+
+
+def shortest_path_tree(csr, edge_costs, node_costs, root, target=None):
+    """
+    Düğüm maliyetleri kenarlara katlanmış (folded) Dijkstra.
+
+    Ağırlıklı skor atlama başına toplamsaldır: her kenar kendi terimini,
+    yoldaki her ara düğüm de kendi terimini ekler. Bir düğümün terimi o
+    düğümden çıkılırken eklenir (kök hariç), böylece kökten v'ye olan
+    mesafe kök ve v hariç aradaki tüm düğümleri içerir. Graf yönsüz
+    olduğundan aynı ağaç, kök hedef seçildiğinde "hedefe kalan maliyet"
+    ağacıdır.
+
+    csr: CSRGraph görünümü
+    edge_costs: Yuva başına ağırlıklı kenar terimi (liste)
+    node_costs: Düğüm ID başına ağırlıklı ara düğüm terimi (liste)
+    target: Verilirse bu düğüm kesinleşince arama durur.
+
+    Dönüş: (dist, parent) listeleri (ulaşılamayan: inf / -1)
+    """
+    n = csr.num_nodes
+    adj = csr.neighbor_lists()
+    indptr = csr.indptr.tolist()
+    dist = [float('inf')] * n
+    parent = [-1] * n
+    done = [False] * n
+
+    dist[root] = 0.0
+    heap = [(0.0, root)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+
+        base = d if u == root else d + node_costs[u]
+        for slot, v in enumerate(adj[u], indptr[u]):
+            nd = base + edge_costs[slot]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return dist, parent
+
+
+def tree_path(parent, src, dst):
+    """Ebeveyn listesinden src -> dst yolunu çıkarır (yol yoksa None)."""
+    path = [dst]
+    while path[-1] != src:
+        prev = parent[path[-1]]
+        if prev < 0:
+            return None
+        path.append(prev)
+    return path[::-1]
+
+
+class DijkstraSolver:
+    """
+    Ağırlıklı maliyeti kesin (optimal) olarak minimize eden Dijkstra çözücüsü.
+
+    calculate_cost formülü atlama başına toplamsal olduğundan (gecikme,
+    -log güvenilirlik, 1000/BW), düğüm terimleri kenarlara katlanarak tek bir
+    Dijkstra ile BW filtreli graf üzerinde gerçek optimum bulunur.
+    GA ve RL için referans (oracle) ve hızlı bir taban çizgisi olarak kullanılır.
+    """
+    def __init__(self, network_model, src, dst, min_bw=0, profile=None):
+        self.model = network_model
+        self.profile = CostProfile.of(profile)
+        # BW Kısıtı: Sadece kapasitesi yeten linkleri içeren CSR görünümünü kullan
+        self.csr = network_model.get_csr(min_bw)
+        self.src = src
+        self.dst = dst
+
+    def solve(self):
+        """
+        En düşük maliyetli yolu bulur.
+
+        Döndürür:
+            best_path (list): Optimal yol (yol yoksa None)
+            best_cost (float): O yolun maliyeti (calculate_cost skoru)
+        """
+        table = self.model.get_cost_table(self.profile)
+        edge_costs = table.edge[self.csr.edge_ids].tolist()
+        node_costs = table.node.tolist()
+
+        _, parent = shortest_path_tree(self.csr, edge_costs, node_costs,
+                                       self.src, target=self.dst)
+        path = tree_path(parent, self.src, self.dst)
+        if not path or len(path) < 2:
+            return None, float('inf')
+
+        return path, self.model.calculate_cost(path, self.profile)['score']
@@ -1,6 +1,68 @@
+import math
+import os
 import random
-import networkx as nx
-from src.config import GA_POP_SIZE, GA_GENERATIONS, GA_MUTATION_RATE
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.config import (GA_POP_SIZE, GA_GENERATIONS, GA_MUTATION_RATE, GA_WEIGHTED_REPAIR, GA_INIT_BIAS,
+                        GA_ISLANDS, GA_MIGRATION_INTERVAL, GA_MIGRANTS,
+                        GA_STALL_GENERATIONS, GA_STALL_EPSILON,
+                        GA_FITNESS_CACHE_SIZE, GA_DEDUPLICATE, GA_WARM_START_SIZE)
+from src.network_model import CostProfile
+
+class WarmStartStore:
+    """
+    Son çözümlerin nihai popülasyonlarını (src, dst) anahtarıyla tutan sınırlı
+    LRU depo. Aynı çift farklı BW talebi / ağırlıklarla tekrar sorgulandığında
+    yeni çözüm, bu bireylerden yeni filtrede hâlâ geçerli olanlarla başlatılır.
+    Thread-safe'tir (GUI çözümleri ayrı thread'lerde çalışır).
+
+    stats: hits / misses ve sıcak (warm) / soğuk (cold) çözümlerin en iyi
+    maliyete ulaştığı nesil sayıları (summary() ile kazanç raporlanır).
+    """
+    def __init__(self, max_size=GA_WARM_START_SIZE):
+        self.max_size = max_size
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'warm_generations': [], 'cold_generations': []}
+
+    def get(self, src, dst):
+        """(src, dst) için saklanan popülasyon (yoksa boş liste)."""
+        with self._lock:
+            population = self._store.get((src, dst))
+            if population is None:
+                self.stats['misses'] += 1
+                return []
+            self._store.move_to_end((src, dst))
+            self.stats['hits'] += 1
+            return population
+
+    def put(self, src, dst, population):
+        with self._lock:
+            self._store[(src, dst)] = list(population)
+            self._store.move_to_end((src, dst))
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def record(self, warm, generations_to_best):
+        """Bir çözümün en iyi maliyete ulaştığı nesli kaydeder."""
+        with self._lock:
+            self.stats['warm_generations' if warm else 'cold_generations'].append(generations_to_best)
+
+    def summary(self):
+        """İsabet oranı ve sıcak başlatmanın kazandırdığı ortalama nesil sayısı."""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            warm, cold = self.stats['warm_generations'], self.stats['cold_generations']
+            return {
+                'hits': self.stats['hits'],
+                'misses': self.stats['misses'],
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+                'generations_saved': float(np.mean(cold) - np.mean(warm)) if warm and cold else None,
+            }
+
 
 class GeneticSolver:
     """
@@ -11,44 +73,103 @@ class GeneticSolver:
     - Operatörler: Çaprazlama (Crossover) ve Mutasyon ile yeni yollar keşfedilir.
     - Amaç: Gecikme, Güvenilirlik ve Kaynak kullanımını optimize etmek.
     """
-    def __init__(self, network_model, src, dst, min_bw=0):
+    def __init__(self, network_model, src, dst, min_bw=0, profile=None,
+                 weighted_repair=GA_WEIGHTED_REPAIR, init_bias=GA_INIT_BIAS, dedup=GA_DEDUPLICATE,
+                 warm_start=None):
         self.model = network_model
-        # BW Kısıtı: Sadece kapasitesi yeten linkleri içeren alt-grafı kullan
-        self.graph = network_model.get_filtered_graph(min_bw)
+        # Ağırlıklar çözüm boyunca sabit (değişmez profil; None -> config varsayılanı)
+        self.profile = CostProfile.of(profile)
+        # BW Kısıtı: Sadece kapasitesi yeten linkleri içeren CSR görünümünü kullan
+        self.csr = network_model.get_csr(min_bw)
+        self.adj = self.csr.neighbor_lists()
+        self.min_bw = min_bw
+        self.weighted_repair = weighted_repair
+        self.init_bias = init_bias
+        self.dedup = dedup
+        self.warm_start = warm_start  # WarmStartStore (None -> her çözüm rastgele başlar)
+        # Çözüm başına yol -> maliyet önbelleği (LRU, GA_FITNESS_CACHE_SIZE ile sınırlı)
+        self.fitness_cache = OrderedDict()
         self.src = src
         self.dst = dst
         self.population = [] # Kromozomlar (Yollar)
+        self.stats = {}       # Son çözümün istatistikleri (başlatma, durma nedeni, nesil sayısı)
+        # Mutasyon yamaları için dst kökenli next-hop ağacı (çözüm başına bir kez,
+        # aynı hedef/BW için model önbelleğinden yeniden kullanılır)
+        self.next_hop = network_model.get_next_hop_tree(
+            dst, min_bw, self.profile if weighted_repair else None)
+        # Filtrelenmiş grafta dst'ye ulaşabilen düğümler (rastgele yürüyüşler bunlarla sınırlı)
+        self.reachable = [d != float('inf') for d in network_model.get_distances_to(dst, min_bw)]
+        # Yönlendirme (bias) için düğüm başına dst'ye kalan ağırlıklı maliyet
+        self.remaining = network_model.get_distances_to(dst, min_bw, self.profile) if init_bias else None
 
-    def create_random_path(self):
+    def path_to_dst(self, node):
+        """next-hop ağacında işaretçi takibiyle node -> dst yolunu döndürür (yoksa None)."""
+        path = [node]
+        while node != self.dst:
+            node = self.next_hop[node]
+            if node < 0:
+                return None
+            path.append(node)
+        return path
+
+    def create_random_path(self, repair=False):
         """
         Başlangıçtan hedefe rastgele (geçerli) bir yol oluşturur.
         Döngüye girmemesi için ziyaret edilenleri takip eder.
+
+        Yürüyüş sadece dst'ye ulaşabilen düğümlerden geçer. Yine de çıkmaza
+        girerse veya çok uzarsa (max 50) None döner; repair=True ise
+        next-hop ağacıyla tamamlanır (src dst'ye ulaşabiliyorsa her zaman geçerli yol).
         """
+        if not self.reachable[self.src]:
+            return None
+
         path = [self.src]
         curr = self.src
         visited = {self.src}
         
         while curr != self.dst:
-            # Gidilebilecek, henüz gezilmemiş komşular
-            neighbors = [n for n in self.graph.neighbors(curr) if n not in visited]
+            # Gidilebilecek, henüz gezilmemiş ve dst'ye ulaşabilen komşular
+            neighbors = [n for n in self.adj[curr] if n not in visited and self.reachable[n]]
             
-            # Çıkmaz sokaksa veya yol çok uzadıysa (max 50) iptal
+            # Çıkmaz sokaksa veya yol çok uzadıysa (max 50) iptal / ağaçla tamamla
             if not neighbors or len(path) > 50: 
-                return None
+                return self.complete_path(path) if repair else None
             
-            curr = random.choice(neighbors)
+            if self.init_bias:
+                # Kalan maliyeti düşük komşulara üstel olarak daha yüksek olasılık
+                best = min(self.remaining[n] for n in neighbors)
+                weights = [math.exp(-self.init_bias * (self.remaining[n] - best)) for n in neighbors]
+                curr = random.choices(neighbors, weights)[0]
+            else:
+                curr = random.choice(neighbors)
             path.append(curr)
             visited.add(curr)
             
         return path
 
+    def complete_path(self, path):
+        """
+        Yarım kalmış yürüyüşü dst'ye tamamlar: ağaç yolu yürüyüşün önceki
+        kısmıyla kesişmeyen en son düğümden itibaren next-hop ağacı izlenir.
+        Ağaç yolları döngüsüz olduğundan en kötü durumda [src] + ağaç yolu döner.
+        """
+        prefix = set(path)
+        for i in range(len(path) - 1, -1, -1):
+            prefix.discard(path[i])
+            tail = self.path_to_dst(path[i])
+            if tail and prefix.isdisjoint(tail):
+                return path[:i] + tail
+        return None
+
     def crossover(self, parent1, parent2):
         """
         Çaprazlama Operatörü: İki ebeveyn yolun ortak bir noktasından
         kesilip parçalarının birleştirilmesiyle yeni bir 'çocuk' yol üretir.
         """
         # Başlangıç ve bitiş hariç ortak düğümleri bul
-        common = [node for node in parent1[1:-1] if node in parent2[1:-1]]
+        inner2 = set(parent2[1:-1])
+        common = [node for node in parent1[1:-1] if node in inner2]
         
         if not common:
             return parent1 # Ortak nokta yoksa değişim yapma
@@ -80,90 +201,547 @@ class GeneticSolver:
         mutate_idx = random.randint(1, len(path)-2)
         sub_src = path[mutate_idx]
         
-        # O noktadan hedefe yeni bir yol bulmayı dene
-        try:
-            # Yamama işlemi için shortest_path kullanıyoruz (ancak sadece ara parça için)
-            sub_path = nx.shortest_path(self.graph, sub_src, self.dst)
+        # O noktadan hedefe ağaç üzerinden yama yap (en az atlama veya en düşük maliyet)
+        sub_path = self.path_to_dst(sub_src)
+        if sub_path:
             new_path = path[:mutate_idx] + sub_path
             
             # Döngü kontrolü
             if len(new_path) == len(set(new_path)):
                 return new_path
-        except:
-            pass
             
         return path
 
-    def solve(self):
+    def seed_population(self):
         """
-        Algoritmayı çalıştıran ana fonksiyon.
-        
-        Döndürür:
-            best_path (list): Bulunan en iyi yol
-            best_cost (float): O yolun maliyeti
-            history (list): Her jenerasyondaki en iyi maliyet (Grafik için)
-            pareto_data (list): Popülasyondaki tüm bireylerin analiz verisi (Scatter plot için)
+        Sıcak başlatma: depodaki önceki popülasyondan, bu çözümün BW filtresinde
+        hâlâ geçerli olan (tekil) yollarla popülasyonun en fazla yarısını doldurur.
+        Kalan yarı rastgele yollarla doldurulur (çeşitlilik korunur).
+        """
+        seeds = _unique(self.warm_start.get(self.src, self.dst)) if self.warm_start else []
+        if seeds:
+            costs = self.model.calculate_costs(seeds, self.profile)
+            valid = np.isfinite(costs['score']) & (costs['bandwidth'] >= self.min_bw)
+            seeds = [p for p, ok in zip(seeds, valid.tolist()) if ok][:GA_POP_SIZE // 2]
+        self.population = list(seeds)
+        self.stats['warm_seeds'] = len(seeds)
+
+    def init_population(self, deadline=None):
+        """
+        Başlangıç popülasyonunu rastgele geçerli yollarla doldurur.
+        deadline verilirse süre dolduğunda (en az bir birey bulunduysa) eksik popülasyonla durur.
+
+        Deneme bütçesi bittiğinde eksik kalan bireyler ağaçla tamamlanan
+        yürüyüşlerle doldurulur; böylece popülasyon sınırlı sürede daima dolar.
+        self.stats'a deneme sayısı ve başarı oranı (init_success_rate) yazılır.
         """
-        # 1. Başlangıç Popülasyonu
-        # Hile yapmıyoruz, tamamen rastgele yollarla başlıyoruz.
         attempts = 0
+        seeded = len(self.population)
         while len(self.population) < GA_POP_SIZE and attempts < GA_POP_SIZE * 50:  # 10'dan 50'ye çıkarıldı
+            if not self.reachable[self.src]:
+                break  # Filtrelenmiş grafta yol yok
             p = self.create_random_path()
             if p: self.population.append(p)
             attempts += 1
+            if deadline is not None and self.population and time.perf_counter() >= deadline:
+                break
+
+        found = len(self.population)
+        if attempts >= GA_POP_SIZE * 50:
+            while len(self.population) < GA_POP_SIZE:
+                self.population.append(self.create_random_path(repair=True))
+
+        self.stats['init_attempts'] = attempts
+        self.stats['init_repaired'] = len(self.population) - found
+        self.stats['init_success_rate'] = (found - seeded) / attempts if attempts else 0.0
+
+    def evaluate(self, paths):
+        """
+        Yolların maliyetlerini döndürür (numpy dizisi). Daha önce görülmüş
+        yollar çözüm başına tutulan sınırlı (LRU) önbellekten okunur, kalanlar
+        tek vektörel geçişte hesaplanır.
+        """
+        scores = np.empty(len(paths))
+        cache = self.fitness_cache
+        missing = {}  # yol demeti -> bu partideki indeksleri
+        for i, p in enumerate(paths):
+            key = tuple(p)
+            cost = cache.get(key)
+            if cost is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                cache.move_to_end(key)
+                scores[i] = cost
+        self.stats['fitness_hits'] = self.stats.get('fitness_hits', 0) + len(paths) - len(missing)
+        self.stats['fitness_misses'] = self.stats.get('fitness_misses', 0) + len(missing)
+
+        if missing:
+            keys = list(missing)
+            costs = self.model.calculate_costs(keys, self.profile)['score'].tolist()
+            for key, cost in zip(keys, costs):
+                scores[missing[key]] = cost
+                cache[key] = cost
+            while len(cache) > GA_FITNESS_CACHE_SIZE:
+                cache.popitem(last=False)
+        return scores
+
+    def deduplicate(self, population, keep):
+        """
+        population[keep:] içinde kendinden öncekilerle aynı olan yolları yeni
+        rastgele bireylerle değiştirir (karma/hash tabanlı, yerinde).
+        """
+        seen = set(map(tuple, population[:keep]))
+        for i in range(keep, len(population)):
+            key = tuple(population[i])
+            # Yeni birey de tekrar ise birkaç deneme yapılır, olmazsa kabul edilir
+            for _ in range(10):
+                if key not in seen:
+                    break
+                fresh = self.create_random_path(repair=True)
+                if fresh is None:
+                    break
+                population[i], key = fresh, tuple(fresh)
+                self.stats['duplicates_replaced'] = self.stats.get('duplicates_replaced', 0) + 1
+            seen.add(key)
+        return population
+
+    def breed(self, selected, count):
+        """Seçilen ebeveynlerden çaprazlama ve mutasyonla count adet çocuk üretir."""
+        children = []
+        if len(selected) < 2:
+            return children
+        while len(children) < count:
+            p1 = random.choice(selected)
+            p2 = random.choice(selected)
+            
+            child = self.crossover(p1, p2)
             
-        if not self.population: return None, float('inf'), [], []
+            if random.random() < GA_MUTATION_RATE:
+                child = self.mutate(child)
+                
+            children.append(child)
+        return children
+
+    def evolve(self, fitness, generations, deadline=None, stall_generations=None):
+        """
+        self.population'ı (uygunluk dizisiyle birlikte) en fazla verilen nesil
+        sayısı kadar evrimleştirir.
+
+        deadline: time.perf_counter() cinsinden bitiş anı (None -> süre sınırı yok)
+        stall_generations: Bu kadar nesil boyunca en iyi maliyet GA_STALL_EPSILON
+            oranından fazla iyileşmezse durulur (None -> erken durma yok)
 
+        Dönüş: (fitness, history, best_path, best_cost, stop_reason)
+        """
         best_path = None
         best_cost = float('inf')
-        
-        history = [] # Yakınsama grafiği için kayıt
-        
-        # 2. Nesiller Boyunca Evrim
-        for gen in range(GA_GENERATIONS):
-            # Maliyetleri hesapla
-            scored_pop = []
-            for p in self.population:
-                cost_data = self.model.calculate_cost(p)
-                cost = cost_data['score']
-                scored_pop.append((cost, p))
-            
-            # Sırala (Küçükten büyüğe)
-            scored_pop.sort(key=lambda x: x[0])
+        history = []
+        stop_reason = 'max_generations'
+
+        # Durgunluk takibi: son anlamlı iyileşmedeki maliyet ve o andan beri geçen nesil
+        stall_ref = float('inf')
+        stalled = 0
+
+        for gen in range(generations):
+            # Sırala (Küçükten büyüğe; eşitlikte eski sıra korunur)
+            order = np.argsort(fitness, kind='stable')
             
             # En iyiyi güncelle
-            current_best = scored_pop[0]
-            if current_best[0] < best_cost:
-                best_cost = current_best[0]
-                best_path = current_best[1]
+            if fitness[order[0]] < best_cost:
+                best_cost = float(fitness[order[0]])
+                best_path = self.population[order[0]]
             
             # Tarihçeye kaydet
-            history.append(current_best[0])
+            history.append(float(fitness[order[0]]))
 
-            # Elitizm: En iyi %50'yi doğrudan sonraki nesle aktar
-            selected = [x[1] for x in scored_pop[:len(scored_pop)//2]]
+            # Erken durma: durgunluk veya süre bütçesi (o ana kadarki en iyi döner)
+            if stall_ref == float('inf') or best_cost < stall_ref - GA_STALL_EPSILON * abs(stall_ref):
+                stall_ref = best_cost
+                stalled = 0
+            else:
+                stalled += 1
+            if stall_generations and stalled >= stall_generations:
+                stop_reason = 'stall'
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                stop_reason = 'deadline'
+                break
+
+            # Elitizm: En iyi %50'yi (uygunluklarıyla birlikte) sonraki nesle aktar
+            elite = order[:len(order)//2]
+            selected = [self.population[i] for i in elite]
             
-            new_generation = list(selected)
+            # Yeni bireyler üret; sadece çocuklar değerlendirilir
+            children = self.breed(selected, GA_POP_SIZE - len(selected))
+            if self.dedup:
+                # Elitler zaten tekil; sadece çocuklar (elitlere ve birbirlerine karşı) ayıklanır
+                children = self.deduplicate(selected + children, len(selected))[len(selected):]
             
-            # Yeni bireyler üret (Crossover & Mutation)
-            while len(new_generation) < GA_POP_SIZE:
-                if len(selected) < 2: break
-                p1 = random.choice(selected)
-                p2 = random.choice(selected)
-                
-                child = self.crossover(p1, p2)
-                
+            self.population = selected + children
+            fitness = np.concatenate([fitness[elite], self.evaluate(children)])
+
+        return fitness, history, best_path, best_cost, stop_reason
+
+    def pareto_data(self, population):
+        """Analiz için popülasyondaki bireylerin metrikleri (Pareto grafiği)."""
+        return [self.model.calculate_metrics(p, self.profile) for p in population]
+
+    def solve(self, deadline_ms=None, stall_generations=GA_STALL_GENERATIONS):
+        """
+        Algoritmayı çalıştıran ana fonksiyon.
+
+        deadline_ms: Süre bütçesi (ms). Dolduğunda o ana kadarki en iyi yol
+            döndürülür (anytime mod). None -> süre sınırı yok.
+        stall_generations: Durgunluk sonrası erken durma eşiği (None -> kapalı)
+        
+        Döndürür:
+            best_path (list): Bulunan en iyi yol
+            best_cost (float): O yolun maliyeti
+            history (list): Her jenerasyondaki en iyi maliyet (Grafik için)
+            pareto_data (list): Popülasyondaki tüm bireylerin analiz verisi (Scatter plot için)
+
+        Durma nedeni, nesil sayısı ve başlatma metrikleri self.stats içinde raporlanır:
+            {'generations': int, 'stop_reason': 'max_generations' | 'stall' | 'deadline' | 'no_path',
+             'init_attempts': int, 'init_repaired': int, 'init_success_rate': float,
+             'fitness_hits': int, 'fitness_misses': int, 'fitness_hit_rate': float,
+             'duplicates_replaced': int (sadece dedup açıkken),
+             'warm_seeds': int, 'generations_to_best': int}
+        """
+        deadline = None
+        if deadline_ms is not None:
+            deadline = time.perf_counter() + deadline_ms / 1000
+
+        # 1. Başlangıç Popülasyonu
+        # Hile yapmıyoruz, tamamen rastgele yollarla başlıyoruz.
+        self.stats = {}
+        self.fitness_cache.clear()
+        self.seed_population()
+        self.init_population(deadline)
+        if not self.population:
+            self.stats.update(generations=0, stop_reason='no_path')
+            return None, float('inf'), [], []
+        if self.dedup:
+            self.deduplicate(self.population, 1)
+
+        # 2. Nesiller Boyunca Evrim
+        # Uygunluk (fitness) dizisi popülasyonla aynı sırada tutulur
+        fitness = self.evaluate(self.population)
+        _, history, best_path, best_cost, stop_reason = self.evolve(
+            fitness, GA_GENERATIONS, deadline, stall_generations)
+        evaluations = self.stats['fitness_hits'] + self.stats['fitness_misses']
+        self.stats.update(generations=len(history), stop_reason=stop_reason,
+                          fitness_hit_rate=self.stats['fitness_hits'] / evaluations,
+                          generations_to_best=history.index(best_cost) + 1)
+
+        if self.warm_start is not None:
+            self.warm_start.record(self.stats['warm_seeds'] > 0, self.stats['generations_to_best'])
+            self.warm_start.put(self.src, self.dst, self.population)
+
+        return best_path, best_cost, history, self.pareto_data(self.population)
+
+    def solve_islands(self, n_islands=GA_ISLANDS, migration_interval=GA_MIGRATION_INTERVAL,
+                      n_migrants=GA_MIGRANTS, workers=None, deadline_ms=None,
+                      stall_generations=GA_STALL_GENERATIONS):
+        """
+        Ada (island) modeli: n_islands alt popülasyon ayrı süreçlerde evrimleşir.
+        Her migration_interval nesilde bir, her adanın en iyi n_migrants bireyi
+        halka (ring) düzeninde bir sonraki adanın en kötü bireylerinin yerine geçer.
+        Topoloji her worker'a süreç başına bir kez aktarılır (salt okunur).
+
+        workers: Süreç sayısı (None -> min(ada sayısı, CPU sayısı), 1 -> aynı süreçte seri)
+        deadline_ms / stall_generations: solve() ile aynı; göç aralıklarında
+            (birleşik tarihçe üzerinden) kontrol edilir.
+
+        Döndürür: solve() ile aynı (best_path, best_cost, history, pareto_data)
+        """
+        deadline = None
+        if deadline_ms is not None:
+            deadline = time.perf_counter() + deadline_ms / 1000
+
+        # Her ada kendi rastgele sayı durumuyla ilerler (tohumlar ana süreçten türetilir)
+        islands = []
+        for _ in range(n_islands):
+            rng = random.Random(random.getrandbits(64))
+            islands.append(([], None, rng.getstate()))
+
+        params = (self.src, self.dst, self.min_bw, self.profile, self.weighted_repair,
+                  self.init_bias, self.dedup)
+        workers = workers or min(n_islands, os.cpu_count() or 1)
+
+        history = []
+        best_path, best_cost = None, float('inf')
+        generations = 0
+        stop_reason = 'max_generations'
+        if workers <= 1:
+            main_state = random.getstate()
+            _init_island_worker(self.model, params)
+            run = lambda tasks: [_evolve_island(*t) for t in tasks]
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_island_worker,
+                                       initargs=(self.model, params))
+            run = lambda tasks: list(pool.map(_evolve_island, *zip(*tasks)))
+
+        try:
+            while generations < GA_GENERATIONS:
+                epoch = min(migration_interval, GA_GENERATIONS - generations)
+                results = run([(pop, fit, state, epoch) for pop, fit, state in islands])
+                generations += epoch
+
+                islands = [(pop, fit, state) for pop, fit, state, *_ in results]
+                if not any(pop for pop, _, _ in islands):
+                    self.stats = {'generations': 0, 'stop_reason': 'no_path'}
+                    return None, float('inf'), [], []
+
+                # Birleşik tarihçe: her nesilde adaların en iyisi
+                histories = [hist for *_, hist, _, _ in results if hist]
+                history.extend(min(h) for h in zip(*histories))
+                for *_, path, cost in results:
+                    if cost < best_cost:
+                        best_path, best_cost = path, cost
+
+                if generations >= GA_GENERATIONS:
+                    break
+                if stall_generations and _stalled(history, stall_generations):
+                    stop_reason = 'stall'
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    stop_reason = 'deadline'
+                    break
+                if n_islands > 1:
+                    islands = _migrate(islands, n_migrants)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            else:
+                # Seri modda model bu süreçteki global'de kalmasın (bellek tutulmasın)
+                global _ISLAND
+                _ISLAND = None
+                random.setstate(main_state)
+
+        # Analiz için adaların son popülasyonları birleştirilir
+        self.population = [p for pop, _, _ in islands for p in pop]
+        self.stats = {'generations': len(history), 'stop_reason': stop_reason}
+        return best_path, best_cost, history, self.pareto_data(self.population)
+
+    def objectives(self, paths):
+        """
+        Çok amaçlı mod için ham amaç matrisi (n_yol x 3, hepsi minimize edilir):
+        gecikme, güvenilirlik maliyeti (-log güvenilirlik), kaynak kullanımı.
+        Geçersiz yollar inf alır.
+        """
+        if not paths:
+            return np.empty((0, 3))
+        costs = self.model.calculate_costs(paths, self.profile)
+        return np.column_stack([costs['delay'], costs['rel_cost'], costs['resource']])
+
+    def solve_pareto(self, deadline_ms=None):
+        """
+        NSGA-II tarzı çok amaçlı GA: ağırlıklar yerine üç ham amaç (gecikme,
+        güvenilirlik, kaynak) birlikte optimize edilir. Her nesilde ebeveyn +
+        çocuk birleşimi hızlı baskınlık sıralaması (non-dominated sorting) ve
+        kalabalık mesafesi (crowding distance) ile GA_POP_SIZE bireye indirilir.
+        Tek çalıştırma, ağırlık taramasının (weight sweep) yerini alır.
+
+        Döndürür:
+            front (list): Son popülasyondaki baskın olunmayan (Pareto) yollar
+            pareto_data (list): Bu yolların metrikleri (calculate_metrics; 'cost'
+                solver'ın ağırlık profiline göredir)
+        """
+        deadline = None
+        if deadline_ms is not None:
+            deadline = time.perf_counter() + deadline_ms / 1000
+
+        self.stats = {}
+        self.init_population(deadline)
+        if not self.population:
+            self.stats.update(generations=0, stop_reason='no_path')
+            return [], []
+
+        population = _unique(self.population)
+        objectives = self.objectives(population)
+        rank, crowding = _rank_and_crowding(objectives)
+        stop_reason = 'max_generations'
+        generations = 0
+
+        while generations < GA_GENERATIONS:
+            if deadline is not None and time.perf_counter() >= deadline:
+                stop_reason = 'deadline'
+                break
+
+            # Çocuklar ikili turnuvayla (önce sıra, sonra kalabalık mesafesi) seçilen ebeveynlerden
+            children = []
+            while len(children) < GA_POP_SIZE:
+                child = self.crossover(population[_tournament(rank, crowding)],
+                                       population[_tournament(rank, crowding)])
                 if random.random() < GA_MUTATION_RATE:
                     child = self.mutate(child)
-                    
-                new_generation.append(child)
-            
-            self.population = new_generation
+                children.append(child)
+
+            # Ebeveyn + çocuk birleşimi (tekrarlar kalabalık mesafesini bozmasın diye atılır)
+            seen = set(map(tuple, population))
+            children = _unique([c for c in children if tuple(c) not in seen])
+            combined = population + children
+            combined_obj = np.vstack([objectives, self.objectives(children)])
+
+            keep = _select_survivors(combined_obj, GA_POP_SIZE)
+            population = [combined[i] for i in keep]
+            objectives = combined_obj[keep]
+            rank, crowding = _rank_and_crowding(objectives)
+            generations += 1
+
+        self.population = population
+        self.stats.update(generations=generations, stop_reason=stop_reason)
+
+        front = [p for p, r, o in zip(population, rank, objectives)
+                 if r == 0 and np.isfinite(o).all()]
+        return front, self.pareto_data(front)
+
+
+# Ada worker'larının paylaştığı (salt okunur) model ve çözücü parametreleri
+_ISLAND = None
+
+
+def _init_island_worker(model, params):
+    """Worker başlangıcı: model ve çözüm parametreleri süreç başına bir kez alınır."""
+    global _ISLAND
+    _ISLAND = (model, params)
+
+
+def _evolve_island(population, fitness, rng_state, generations):
+    """
+    Bir adayı generations nesil evrimleştirir (ilk çağrıda popülasyonu oluşturur).
+    Dönüş: (population, fitness, rng_state, history, best_path, best_cost)
+    """
+    model, params = _ISLAND
+    random.setstate(rng_state)
+    solver = GeneticSolver(model, *params)
+    solver.population = population
+    if fitness is None:
+        solver.init_population()
+        fitness = solver.evaluate(solver.population)
+    if not solver.population:
+        return [], np.empty(0), random.getstate(), [], None, float('inf')
+
+    fitness, history, best_path, best_cost, _ = solver.evolve(fitness, generations)
+    return solver.population, fitness, random.getstate(), history, best_path, best_cost
+
+
+def _unique(paths):
+    """Sırayı koruyarak tekrarlanan yolları atar."""
+    seen = set()
+    result = []
+    for p in paths:
+        key = tuple(p)
+        if key not in seen:
+            seen.add(key)
+            result.append(p)
+    return result
+
+
+def _non_dominated_sort(objectives):
+    """
+    Hızlı baskınlık sıralaması: her bireyin Pareto cephe numarası (0 = baskın
+    olunmayan cephe). i, j'ye her amaçta eşit/daha iyi ve en az birinde daha
+    iyiyse baskındır. Baskınlık matrisi tek vektörel işlemle kurulur.
+    """
+    n = len(objectives)
+    a, b = objectives[:, None, :], objectives[None, :, :]
+    dominates = (a <= b).all(axis=2) & (a < b).any(axis=2)  # [i, j]: i, j'ye baskın
+
+    dominated_by = dominates.sum(axis=0)
+    rank = np.full(n, -1)
+    front = np.flatnonzero(dominated_by == 0)
+    r = 0
+    while front.size:
+        rank[front] = r
+        dominated_by -= dominates[front].sum(axis=0)
+        dominated_by[rank >= 0] = -1
+        front = np.flatnonzero(dominated_by == 0)
+        r += 1
+    return rank
+
+
+def _crowding_distance(objectives):
+    """Tek bir cephe içinde kalabalık mesafesi (uç noktalar: inf)."""
+    n = len(objectives)
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+    for k in range(objectives.shape[1]):
+        order = np.argsort(objectives[:, k], kind='stable')
+        values = objectives[order, k]
+        distance[order[[0, -1]]] = np.inf
+        span = values[-1] - values[0]
+        if span > 0 and np.isfinite(span):
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
+def _rank_and_crowding(objectives):
+    """Her birey için (cephe numarası, cephe içi kalabalık mesafesi)."""
+    rank = _non_dominated_sort(objectives)
+    crowding = np.zeros(len(objectives))
+    for r in np.unique(rank):
+        members = np.flatnonzero(rank == r)
+        crowding[members] = _crowding_distance(objectives[members])
+    return rank, crowding
+
+
+def _tournament(rank, crowding):
+    """İkili turnuva: düşük cephe numarası, eşitlikte büyük kalabalık mesafesi kazanır."""
+    i = random.randrange(len(rank))
+    j = random.randrange(len(rank))
+    if rank[i] != rank[j]:
+        return i if rank[i] < rank[j] else j
+    return i if crowding[i] >= crowding[j] else j
+
+
+def _select_survivors(objectives, size):
+    """NSGA-II elitist seçimi: cepheler sırayla, son cephe kalabalık mesafesiyle doldurulur."""
+    rank = _non_dominated_sort(objectives)
+    keep = []
+    for r in np.unique(rank):
+        members = np.flatnonzero(rank == r)
+        if len(keep) + len(members) <= size:
+            keep.extend(members.tolist())
+        else:
+            crowding = _crowding_distance(objectives[members])
+            order = np.argsort(-crowding, kind='stable')
+            keep.extend(members[order[:size - len(keep)]].tolist())
+        if len(keep) >= size:
+            break
+    return np.array(keep)
+
+
+def _stalled(history, stall_generations):
+    """Son stall_generations nesilde en iyi maliyet GA_STALL_EPSILON oranından fazla iyileşmedi mi?"""
+    if len(history) <= stall_generations:
+        return False
+    ref = min(history[:-stall_generations])
+    return min(history[-stall_generations:]) >= ref - GA_STALL_EPSILON * abs(ref)
+
 
-        # Analiz için son popülasyon verilerini hazırla (Pareto)
-        pareto_data = []
-        for p in self.population:
-            metrics = self.model.calculate_metrics(p) # Bu fonksiyonu Model'e ekleyeceğiz
-            pareto_data.append(metrics)
+def _migrate(islands, n_migrants):
+    """Halka göçü: i. adanın en iyi bireyleri (i+1). adanın en kötülerinin yerine geçer."""
+    migrants = []
+    for pop, fit, _ in islands:
+        best = np.argsort(fit, kind='stable')[:n_migrants]
+        migrants.append(([pop[i] for i in best], fit[best]))
 
-        return best_path, best_cost, history, pareto_data
\ No newline at end of file
+    result = []
+    for i, (pop, fit, state) in enumerate(islands):
+        paths, costs = migrants[i - 1]
+        k = min(len(paths), len(pop) // 2)
+        if k == 0:
+            result.append((pop, fit, state))
+            continue
+        # En kötü k birey; en iyi yarı (elitler) asla değiştirilmez
+        worst = np.argsort(fit, kind='stable')[len(pop) - k:]
+        pop, fit = list(pop), fit.copy()
+        for j, idx in enumerate(worst):
+            pop[idx] = paths[j]
+            fit[idx] = costs[j]
+        result.append((pop, fit, state))
+    return result
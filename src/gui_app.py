@@ -10,10 +10,9 @@ import matplotlib.gridspec as gridspec
 # Proje Modüllerini Ekle
 sys.path.append('.')
 from src.config import NODE_FILE, EDGE_FILE
-from src.network_model import NetworkModel
-from src.ga_solver import GeneticSolver
-from src.rl_solver import QLearningSolver
-import src.config as config
+from src.network_model import NetworkModel, CostProfile
+from src.ga_solver import GeneticSolver, WarmStartStore
+from src.rl_solver import QLearningSolver, QTableCache
 
 class QoSRoutingApp:
     """
@@ -34,6 +33,10 @@ class QoSRoutingApp:
         self.status_var = tk.StringVar()
         self.status_var.set("Ağ Modeli Yükleniyor...")
         self.network = None
+        # Aynı (S, D) tekrar sorgulandığında GA önceki popülasyonla başlar
+        self.warm_store = WarmStartStore()
+        # Aynı sorgu tekrar çözüldüğünde RL eğitilmiş Q-Tablosunu devralıp kısa eğitir
+        self.q_cache = QTableCache()
         
         # Arayüz Bileşenlerini Oluştur
         self.create_layout()
@@ -170,6 +173,11 @@ class QoSRoutingApp:
         make_slider("Gecikme:", self.w_delay_var)
         make_slider("Güven:", self.w_rel_var)
         make_slider("Kaynak:", self.w_res_var)
+
+        # Çok amaçlı mod: Pareto grafiğinde GA popülasyonu yerine gerçek cephe
+        self.pareto_mode_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Pareto Cephesi (NSGA-II)",
+                        variable=self.pareto_mode_var).pack(anchor=tk.W, pady=(5, 0))
         
         # Buton
         ttk.Separator(frame, orient='horizontal').pack(fill=tk.X, pady=10)
@@ -202,10 +210,10 @@ class QoSRoutingApp:
             messagebox.showerror("Hata", "Kaynak ve hedef aynı olamaz.")
             return
 
-        # Ağırlıkları Config'e işle
-        config.W_DELAY = self.w_delay_var.get()
-        config.W_RELIABILITY = self.w_rel_var.get()
-        config.W_RESOURCE = self.w_res_var.get()
+        # Ağırlıklar bu sorguya özel, değişmez bir profil olarak aktarılır
+        profile = CostProfile(self.w_delay_var.get(),
+                              self.w_rel_var.get(),
+                              self.w_res_var.get())
 
         self.btn_run['state'] = 'disabled'
         self.status_var.set("Algoritmalar çalışıyor...")
@@ -213,27 +221,34 @@ class QoSRoutingApp:
         self.result_text.insert(tk.END, "Lütfen bekleyin, hesaplanıyor...\n(RL eğitimi zaman alabilir)")
         
         bw_demand = self.bw_demand_var.get()
-        threading.Thread(target=self._solve_thread, args=(src, dst, bw_demand)).start()
+        pareto_mode = self.pareto_mode_var.get()
+        threading.Thread(target=self._solve_thread, args=(src, dst, bw_demand, profile, pareto_mode)).start()
 
-    def _solve_thread(self, src, dst, bw_demand):
+    def _solve_thread(self, src, dst, bw_demand, profile, pareto_mode=False):
         try:
             # GA Çalıştır
-            ga = GeneticSolver(self.network, src, dst, min_bw=bw_demand)
+            ga = GeneticSolver(self.network, src, dst, min_bw=bw_demand, profile=profile,
+                               warm_start=self.warm_store)
             # solve() artık (path, cost, history, pareto_data) dönüyor
             ga_path, ga_cost, ga_hist, ga_pareto = ga.solve()
+            if pareto_mode:
+                # Tek çok amaçlı çalıştırma: ağırlıklardan bağımsız gerçek Pareto cephesi
+                _, ga_pareto = GeneticSolver(self.network, src, dst, min_bw=bw_demand,
+                                             profile=profile).solve_pareto()
             
             # RL Çalıştır
-            rl = QLearningSolver(self.network, src, dst, min_bw=bw_demand)
+            rl = QLearningSolver(self.network, src, dst, min_bw=bw_demand, profile=profile,
+                                 q_cache=self.q_cache)
             # train() artık history dönüyor
             rl_hist = rl.train()
             rl_path = rl.get_path()
-            rl_cost_data = self.network.calculate_cost(rl_path)
+            rl_cost_data = self.network.calculate_cost(rl_path, profile)
             rl_cost = rl_cost_data['score']
             
             # GUI Güncelleme
-            self.root.after(0, lambda: self.show_results(src, dst, 
+            self.root.after(0, lambda: self.show_results(src, dst, profile,
                                                          ga_path, ga_cost, ga_hist, ga_pareto,
-                                                         rl_path, rl_cost, rl_hist))
+                                                         rl_path, rl_cost, rl_hist, pareto_mode, rl.stats))
         except Exception as e:
             # Hata Olursa Kullanıcıya Bildir ve Butonu Aç
             print(f"Hata detayı: {e}")
@@ -247,11 +262,12 @@ class QoSRoutingApp:
         self.result_text.delete(1.0, tk.END)
         self.result_text.insert(tk.END, "İşlem başarısız oldu.")
 
-    def show_results(self, src, dst, ga_path, ga_cost, ga_hist, ga_pareto, rl_path, rl_cost, rl_hist):
+    def show_results(self, src, dst, profile, ga_path, ga_cost, ga_hist, ga_pareto, rl_path, rl_cost, rl_hist,
+                     pareto_mode=False, rl_stats=None):
         try:
             # 1. Metin Sonuçları
-            metrics_ga = self.network.calculate_metrics(ga_path)
-            metrics_rl = self.network.calculate_metrics(rl_path)
+            metrics_ga = self.network.calculate_metrics(ga_path, profile)
+            metrics_rl = self.network.calculate_metrics(rl_path, profile)
             
             bw_demand = self.bw_demand_var.get()
             ga_min_bw = self.network.get_path_min_bandwidth(ga_path)
@@ -272,6 +288,8 @@ class QoSRoutingApp:
                     res += " \n"
                 else:
                     res += "  (Yetersiz!)\n"
+                warm = self.warm_store.summary()
+                res += f"Sıcak Başlatma: {warm['hits']}/{warm['hits'] + warm['misses']} isabet\n"
             else: res += "Yol bulunamadı.\n"
             
             res += "\n Q-LEARNING (RL)\n"
@@ -285,6 +303,10 @@ class QoSRoutingApp:
                     res += " \n"
                 else:
                     res += "  (Yetersiz!)\n"
+                if rl_stats:
+                    res += f"Eğitim: {rl_stats['episodes']} bölüm ({rl_stats['stop_reason']})\n"
+                cache = self.q_cache.summary()
+                res += f"Q-Tablosu Önbelleği: {cache['hits']}/{cache['hits'] + cache['misses']} isabet\n"
             else: res += "Yol bulunamadı.\n"
             
             self.result_text.delete(1.0, tk.END)
@@ -375,14 +397,20 @@ class QoSRoutingApp:
             self.ax_pareto.set_ylabel("Güvenilirlik (Reliability) [Daha çok iyi]")
             self.ax_pareto.grid(True, linestyle='--', alpha=0.6)
             
-            # GA popülasyonundaki tüm bireyleri çiz
+            # GA popülasyonundaki tüm bireyleri (veya NSGA-II Pareto cephesini) çiz
             if ga_pareto:
                 delays = [d['delay'] for d in ga_pareto]
                 reliabilities = [d['reliability'] for d in ga_pareto]
-                costs = [d['cost'] for d in ga_pareto]
                 
-                sc = self.ax_pareto.scatter(delays, reliabilities, c=costs, cmap='inferno_r', label="GA Çözüm Adayları", alpha=0.8, edgecolors='black')
-                self.fig_analysis.colorbar(sc, ax=self.ax_pareto, label="Toplam Maliyet")
+                if pareto_mode:
+                    # Üçüncü amaç (kaynak kullanımı) renk ile gösterilir
+                    resources = [d['resource'] for d in ga_pareto]
+                    sc = self.ax_pareto.scatter(delays, reliabilities, c=resources, cmap='viridis', label="GA Pareto Cephesi", alpha=0.9, edgecolors='black')
+                    self.fig_analysis.colorbar(sc, ax=self.ax_pareto, label="Kaynak Kullanımı (1000/BW)")
+                else:
+                    costs = [d['cost'] for d in ga_pareto]
+                    sc = self.ax_pareto.scatter(delays, reliabilities, c=costs, cmap='inferno_r', label="GA Çözüm Adayları", alpha=0.8, edgecolors='black')
+                    self.fig_analysis.colorbar(sc, ax=self.ax_pareto, label="Toplam Maliyet")
                 
             # RL Sonucunu da ekle
             if metrics_rl:
@@ -1,42 +1,574 @@
 # src/network_model.py
+import os
 import pandas as pd
+import numpy as np
 import networkx as nx
 import math
-from .config import W_DELAY, W_RELIABILITY, W_RESOURCE
+from bisect import bisect_left
+import threading
+from collections import OrderedDict, namedtuple
+from . import config
+from .config import (COST_TABLE_CACHE_SIZE, FILTER_CACHE_SIZE, NEXT_HOP_CACHE_SIZE,
+                     ROUTE_TABLE_BW_CLASSES)
+
+# İkili (binary) graf önbelleğinin biçim sürümü.
+# Önbellekteki dizilerin düzeni değişirse artırılmalıdır; eski dosyalar yok sayılır.
+GRAPH_CACHE_VERSION = 1
+
+
+def _to_float_array(series):
+    """CSV sütununu float dizisine çevirir (gerekirse virgülü noktaya çevirerek)."""
+    if series.dtype == object:
+        series = series.astype(str).str.replace(',', '.')
+    return series.astype(float).to_numpy()
+
+
+class CostProfile(namedtuple('CostProfile', ['w_delay', 'w_reliability', 'w_resource'])):
+    """
+    Değişmez (immutable) QoS ağırlık profili: (Gecikme, Güvenilirlik, Kaynak).
+
+    Ağırlıklar modül seviyesindeki config değişkenleri değiştirilerek değil,
+    bu nesne ile açıkça aktarılır. Böylece aynı süreçte farklı ağırlıklarla
+    eşzamanlı (thread/worker) sorgular birbirini etkilemez.
+    Hashlenebilir olduğu için önbellek anahtarı olarak da kullanılır.
+    """
+    __slots__ = ()
+
+    def __new__(cls, w_delay, w_reliability, w_resource):
+        return super().__new__(cls, float(w_delay), float(w_reliability), float(w_resource))
+
+    @classmethod
+    def default(cls):
+        """config.py'deki varsayılan ağırlıklardan profil oluşturur."""
+        return cls(config.W_DELAY, config.W_RELIABILITY, config.W_RESOURCE)
+
+    @classmethod
+    def of(cls, profile):
+        """None -> varsayılan profil, (w_d, w_r, w_res) üçlüsü -> CostProfile."""
+        if profile is None:
+            return cls.default()
+        if isinstance(profile, cls):
+            return profile
+        return cls(*profile)
+
+    def weighted(self, delay, rel_cost, res_cost):
+        """Ağırlıklı toplam maliyet: W_delay * Gecikme + W_rel * Güven + W_res * Kaynak"""
+        return (self.w_delay * delay) + \
+               (self.w_reliability * rel_cost) + \
+               (self.w_resource * res_cost)
+
+
+class CSRGraph:
+    """
+    Grafın dizi tabanlı, sıkıştırılmış satır (CSR) gösterimi.
+
+    Düğüm ID'leri doğrudan satır indeksi olarak kullanılır (veride olmayan
+    ID'ler boş satırdır). u düğümünün komşuları artan sırada:
+        indices[indptr[u]:indptr[u+1]]
+
+    Her yönlü kenar yuvası (slot) için 'indices' ile paralel diziler:
+        edge_ids         -> Kararlı kenar ID'si (EdgeData satır sırası)
+        bandwidth        -> Bant genişliği (Mbps)
+        link_delay       -> Link gecikmesi (ms)
+        link_reliability -> Link güvenilirliği
+    Düğüm dizileri (ID ile indekslenir):
+        proc_delay, node_reliability
+    """
+    def __init__(self, indptr, indices, edge_ids, bandwidth, link_delay,
+                 link_reliability, proc_delay, node_reliability, full_slots=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+        self.bandwidth = bandwidth
+        self.link_delay = link_delay
+        self.link_reliability = link_reliability
+        self.proc_delay = proc_delay
+        self.node_reliability = node_reliability
+        # Filtresiz CSR'deki karşılık gelen yuva (ağırlıklı tablolara erişim için)
+        if full_slots is None:
+            full_slots = np.arange(len(indices), dtype=np.int64)
+        self.full_slots = full_slots
+        # Her yuvanın çıkış düğümü (vektörel hesaplar için)
+        self.slot_src = np.repeat(np.arange(self.num_nodes, dtype=np.int64),
+                                  np.diff(indptr))
+        self._neighbor_lists = None
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_slots(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        """Dizilerin toplam bellek kullanımı (byte)."""
+        arrays = (self.indptr, self.indices, self.edge_ids, self.bandwidth,
+                  self.link_delay, self.link_reliability, self.proc_delay,
+                  self.node_reliability, self.full_slots, self.slot_src)
+        return sum(a.nbytes for a in arrays)
+
+    def subgraph(self, slot_mask):
+        """Maskeyle seçilen yuvalardan (sırayı koruyarak) yeni bir CSR kurar."""
+        slots = np.flatnonzero(slot_mask)
+        indptr = np.zeros_like(self.indptr)
+        np.cumsum(np.bincount(self.slot_src[slots], minlength=self.num_nodes),
+                  out=indptr[1:])
+        return CSRGraph(indptr, self.indices[slots], self.edge_ids[slots],
+                        self.bandwidth[slots], self.link_delay[slots],
+                        self.link_reliability[slots], self.proc_delay,
+                        self.node_reliability, self.full_slots[slots])
+
+    def neighbors(self, u):
+        """u düğümünün komşularını (dizi dilimi olarak) döndürür."""
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def neighbor_lists(self):
+        """
+        Her düğüm için komşu listesini (Python listesi) döndürür.
+        Saf Python iç döngüleri için bir kez hesaplanıp saklanır.
+        """
+        if self._neighbor_lists is None:
+            flat = self.indices.tolist()
+            bounds = self.indptr.tolist()
+            self._neighbor_lists = [flat[bounds[i]:bounds[i + 1]]
+                                    for i in range(self.num_nodes)]
+        return self._neighbor_lists
+
+    def slot_of(self, u, v):
+        """(u -> v) kenarının yuva indeksini döndürür; kenar yoksa KeyError."""
+        row = self.neighbor_lists()[u]
+        k = bisect_left(row, v)
+        if k == len(row) or row[k] != v:
+            raise KeyError((u, v))
+        return int(self.indptr[u]) + k
+
+    def bfs_tree(self, root):
+        """
+        root kökenli BFS (en az atlama) ağacı. Graf yönsüz olduğundan
+        parent[v], v'den root'a giden en az atlamalı yoldaki bir sonraki
+        düğümdür (next-hop).
+        Dönüş: (dist, parent) listeleri (atlama sayısı; ulaşılamayan: inf / -1)
+        """
+        adj = self.neighbor_lists()
+        dist = [float('inf')] * self.num_nodes
+        parent = [-1] * self.num_nodes
+        dist[root] = 0
+        frontier = [root]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                for v in adj[u]:
+                    if dist[v] == float('inf'):
+                        dist[v] = depth
+                        parent[v] = u
+                        next_frontier.append(v)
+            frontier = next_frontier
+        return dist, parent
+
+
+class CostTable:
+    """
+    Bir ağırlık profili (CostProfile) için önceden hesaplanmış
+    ağırlıklı maliyet dizileri:
+        step -> Filtresiz CSR yuvası başına RL adım maliyeti
+                (link gecikmesi + çıkış düğümü işlem gecikmesi, -log güvenilirlik, 1000/BW)
+        edge -> Kenar ID başına ağırlıklı yol terimi (gecikme, -log güvenilirlik, 1000/BW)
+        node -> Düğüm ID başına ağırlıklı ara düğüm terimi (işlem gecikmesi, -log güvenilirlik)
+    """
+    def __init__(self, profile, step, edge, node):
+        self.profile = profile
+        self.step = step
+        self.edge = edge
+        self.node = node
+
 
 class NetworkModel:
-    def __init__(self, node_file, edge_file):
-        self.graph = nx.Graph()
-        self.load_data(node_file, edge_file)
+    def __init__(self, node_file, edge_file, use_cache=True):
+        self._graph = None  # nx.Graph; ilk erişimde kurulur (bkz. graph)
+
+        # Ham topoloji dizileri (düğüm sırası NodeData, kenar sırası EdgeData ile aynıdır)
+        self.node_ids = np.empty(0, dtype=np.int64)
+        self.node_proc_delay = np.empty(0)
+        self.node_reliability = np.empty(0)
+        self.edge_src = np.empty(0, dtype=np.int64)
+        self.edge_dst = np.empty(0, dtype=np.int64)
+        self.edge_bandwidth = np.empty(0)
+        self.edge_delay = np.empty(0)
+        self.edge_reliability = np.empty(0)
+        self.edge_active = np.empty(0, dtype=bool)  # remove_edge ile kapatılan linkler False
+
+        self._base_csr = None  # Yüklenen tüm kenarları içeren (filtresiz) CSR
+        self.topology_version = 0  # Her topoloji güncellemesinde artar
+        self.source_key = None     # Yüklenen CSV'lerin parmak izi (_cache_key)
+        self._cost_tables = OrderedDict()  # CostProfile -> CostTable (LRU)
+        self._filtered_csrs = OrderedDict()    # BW kesim noktası -> CSRGraph (LRU)
+        self._filtered_graphs = OrderedDict()  # BW kesim noktası -> nx.Graph (LRU)
+        self._next_hop_trees = OrderedDict()   # (hedef, kesim, profil) -> (dist, next_hop) (LRU)
+        self._lock = threading.Lock()      # Paylaşılan önbellekler için
+        self.route_table = None            # build_route_table / load_route_table
+        self.cost_table_stats = {'hits': 0, 'misses': 0}
+
+        self.load_data(node_file, edge_file, use_cache=use_cache)
+
+    def __getstate__(self):
+        # Süreç havuzlarına (ör. GA ada modeli) aktarılırken kilit kopyalanamaz
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def load_data(self, node_file, edge_file, use_cache=True):
+        """
+        Düğüm ve kenar CSV dosyalarını okuyup grafı toplu (bulk) olarak oluşturur.
 
-    def load_data(self, node_file, edge_file):
+        CSV'ler tek geçişte tipli dizilere çevrilir ve CSV'lerin yanına
+        sürümlü bir .npz önbelleği yazılır. Dosyaların boyutu ve değişiklik
+        zamanı (mtime) aynı kaldığı sürece sonraki açılışlarda CSV hiç
+        ayrıştırılmaz, diziler doğrudan önbellekten okunur.
+        """
         try:
-            nodes_df = pd.read_csv(node_file, delimiter=';')
-            edges_df = pd.read_csv(edge_file, delimiter=';')
-
-            # Sayısal düzeltmeler (Virgül -> Nokta)
-            nodes_df['s_ms'] = nodes_df['s_ms'].astype(str).str.replace(',', '.').astype(float)
-            nodes_df['r_node'] = nodes_df['r_node'].astype(str).str.replace(',', '.').astype(float)
-            edges_df['r_link'] = edges_df['r_link'].astype(str).str.replace(',', '.').astype(float)
-
-            for _, row in nodes_df.iterrows():
-                self.graph.add_node(int(row['node_id']), 
-                                    proc_delay=row['s_ms'], 
-                                    reliability=row['r_node'])
-
-            for _, row in edges_df.iterrows():
-                self.graph.add_edge(int(row['src']), int(row['dst']), 
-                                    bandwidth=row['capacity_mbps'], 
-                                    link_delay=row['delay_ms'], 
-                                    reliability=row['r_link'])
-            print(f"[INFO] Ağ Yüklendi: {self.graph.number_of_nodes()} Düğüm.")
+            arrays = None
+            cache_file = self.get_cache_path(edge_file)
+            cache_key = self._cache_key(node_file, edge_file)
+            self.source_key = cache_key
+
+            if use_cache:
+                arrays = self._read_cache(cache_file, cache_key)
+
+            if arrays is None:
+                arrays = self._parse_csv(node_file, edge_file)
+                if use_cache:
+                    self._write_cache(cache_file, cache_key, arrays)
+
+            self._build_graph(arrays)
+            print(f"[INFO] Ağ Yüklendi: {len(self.node_ids)} Düğüm.")
         except Exception as e:
             print(f"[ERROR] Veri yükleme hatası: {e}")
 
-    def calculate_cost(self, path):
+    @staticmethod
+    def get_cache_path(edge_file):
+        """Kenar dosyasının yanındaki önbellek dosyasının yolunu döndürür."""
+        return os.path.splitext(edge_file)[0] + '.cache.npz'
+
+    @staticmethod
+    def _cache_key(node_file, edge_file):
+        """Önbellek anahtarı: sürüm + her iki dosyanın boyutu ve mtime değeri."""
+        parts = [str(GRAPH_CACHE_VERSION)]
+        for path in (node_file, edge_file):
+            st = os.stat(path)
+            parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+        return '|'.join(parts)
+
+    @staticmethod
+    def _parse_csv(node_file, edge_file):
+        """CSV dosyalarını tek geçişte tipli NumPy dizilerine çevirir."""
+        nodes_df = pd.read_csv(node_file, delimiter=';')
+        edges_df = pd.read_csv(edge_file, delimiter=';')
+
+        return {
+            'node_ids': nodes_df['node_id'].to_numpy(dtype=np.int64),
+            'node_proc_delay': _to_float_array(nodes_df['s_ms']),
+            'node_reliability': _to_float_array(nodes_df['r_node']),
+            'edge_src': edges_df['src'].to_numpy(dtype=np.int64),
+            'edge_dst': edges_df['dst'].to_numpy(dtype=np.int64),
+            'edge_bandwidth': _to_float_array(edges_df['capacity_mbps']),
+            'edge_delay': _to_float_array(edges_df['delay_ms']),
+            'edge_reliability': _to_float_array(edges_df['r_link']),
+        }
+
+    @staticmethod
+    def _read_cache(cache_file, cache_key):
+        """Anahtarı eşleşen önbelleği okur; yoksa veya eskiyse None döndürür."""
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with np.load(cache_file, allow_pickle=False) as data:
+                if str(data['cache_key']) != cache_key:
+                    return None
+                return {k: data[k] for k in data.files if k != 'cache_key'}
+        except Exception:
+            return None
+
+    @staticmethod
+    def _write_cache(cache_file, cache_key, arrays):
+        """Önbelleği atomik olarak yazar (yazılamazsa sessizce geçer)."""
+        tmp_file = cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, cache_key=np.array(cache_key), **arrays)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"[WARN] Graf önbelleği yazılamadı: {e}")
+
+    def _build_graph(self, arrays):
+        """
+        Tipli dizilerden topoloji yapılarını (CSR, yol skorlama dizileri) oluşturur.
+        nx grafı burada kurulmaz; sadece ona erişen kod (GUI, görselleştirme)
+        ilk erişimde kurulumun bedelini öder (bkz. graph).
+        """
+        for name, values in arrays.items():
+            # Yazılabilir kopya (artımlı güncellemeler dizileri yerinde yamar)
+            setattr(self, name, np.array(values))
+        self.edge_active = np.ones(len(self.edge_src), dtype=bool)
+        self._base_csr = self._build_csr()
+        self._cost_tables.clear()
+        self._filtered_csrs.clear()
+        self._filtered_graphs.clear()
+        self._next_hop_trees.clear()
+        self._graph = None
+
+        self._precompute_path_arrays()
+
+    @property
+    def graph(self):
+        """
+        Ağın nx.Graph karşılığı (düğüm/kenar özellikleriyle).
+
+        Çözücüler CSR ve dizileri kullandığından graf ilk erişimde, dizilerin
+        o anki halinden (yapılmış güncellemeler ve kapatılan linkler dahil)
+        toplu ekleme ile kurulur; sonraki güncellemeler onu yerinde yamar.
+        """
+        if self._graph is None:
+            graph = nx.Graph()
+            graph.add_nodes_from(
+                (n, {'proc_delay': d, 'reliability': r})
+                for n, d, r in zip(self.node_ids.tolist(),
+                                   self.node_proc_delay.tolist(),
+                                   self.node_reliability.tolist()))
+
+            eids = np.flatnonzero(self.edge_active)
+            graph.add_edges_from(
+                (u, v, {'bandwidth': bw, 'link_delay': d, 'reliability': r})
+                for u, v, bw, d, r in zip(self.edge_src[eids].tolist(),
+                                          self.edge_dst[eids].tolist(),
+                                          self.edge_bandwidth[eids].tolist(),
+                                          self.edge_delay[eids].tolist(),
+                                          self.edge_reliability[eids].tolist()))
+            self._graph = graph
+        return self._graph
+
+    def _precompute_path_arrays(self):
+        """
+        Yol skorlama için kenar/düğüm başına toplamsal bileşenleri bir kez hesaplar.
+        (-log güvenilirlik ve 1000/BW değerleri; skaler formülle birebir aynı)
+        """
+        rel = self.edge_reliability.tolist()
+        bw = self.edge_bandwidth.tolist()
+        self._edge_rel_cost = np.array([-math.log(r) if r > 0 else 0.0 for r in rel])
+        self._edge_rel_factor = np.array([r if r > 0 else 1.0 for r in rel])
+        self._edge_res_cost = np.array([1000.0 / b if b > 0 else 0.0 for b in bw])
+        self._edge_min_bw = np.array([b if b > 0 else np.inf for b in bw])
+
+        # Bant genişliği indeksi: kenarlar BW'ye göre sıralı (eşik -> kesim noktası)
+        self._bw_order = np.argsort(self.edge_bandwidth, kind='stable')
+        self._bw_sorted = self.edge_bandwidth[self._bw_order]
+        self._bw_pos = np.empty_like(self._bw_order)
+        self._bw_pos[self._bw_order] = np.arange(len(self._bw_order))
+
+        csr = self._base_csr
+        n = csr.num_nodes
+        # Kenar ID -> filtresiz CSR'deki iki yönlü yuvası
+        self._edge_slots = np.argsort(csr.edge_ids, kind='stable').reshape(-1, 2)
+        node_rel = csr.node_reliability.tolist()
+        self._node_delay = csr.proc_delay
+        self._node_reliability = csr.node_reliability
+        self._node_rel_cost = np.array([-math.log(r) if r > 0 else 0.0 for r in node_rel])
+        self._node_rel_factor = np.array([r if r > 0 else 1.0 for r in node_rel])
+
+        # (u, v) -> kenar ID eşlemesi için sıralı anahtarlar (u * n + v)
+        self._edge_keys = csr.slot_src * n + csr.indices
+        self._edge_key_ids = csr.edge_ids
+
+        # RL adım maliyeti bileşenleri (yönlü, filtresiz CSR yuvası başına)
+        self._slot_step_delay = csr.link_delay + csr.proc_delay[csr.slot_src]
+        self._slot_rel_cost = self._edge_rel_cost[csr.edge_ids]
+        self._slot_res_cost = self._edge_res_cost[csr.edge_ids]
+
+        # Tekil yol skorlama (saf Python) için aynı değerlerin liste kopyaları
+        self._edge_terms = list(zip(self.edge_delay.tolist(), self._edge_rel_cost.tolist(),
+                                    self._edge_rel_factor.tolist(), self._edge_res_cost.tolist(),
+                                    self._edge_min_bw.tolist(), [r <= 0 for r in rel]))
+        self._node_terms = list(zip(self._node_delay.tolist(), self._node_rel_cost.tolist(),
+                                    self._node_rel_factor.tolist(), [r <= 0 for r in node_rel]))
+        self._slot_edge_ids = csr.edge_ids.tolist()
+
+    def _as_padded(self, paths):
+        """Yol listesini (veya dolgulu matrisi) -1 ile dolgulu int matrise çevirir."""
+        if isinstance(paths, np.ndarray):
+            return np.atleast_2d(paths).astype(np.int64, copy=False)
+
+        lengths = np.fromiter((len(p) for p in paths), dtype=np.int64, count=len(paths))
+        width = int(lengths.max()) if len(lengths) else 0
+        padded = np.full((len(paths), width), -1, dtype=np.int64)
+        flat = np.fromiter((n for p in paths for n in p), dtype=np.int64,
+                           count=int(lengths.sum()))
+        padded[np.arange(width) < lengths[:, None]] = flat
+        return padded
+
+    def _score_paths(self, paths, profile):
+        """
+        Yolları tek vektörel geçişte skorlar (yuvarlama yapılmaz).
+
+        Toplamlar, skaler calculate_cost ile aynı sırada (atlama atlama)
+        biriktirilir; böylece sonuçlar bit düzeyinde aynıdır.
+        Geçersiz yollar (tek düğümlü, boş veya olmayan kenar içeren)
+        'valid' = False ile işaretlenir.
+        """
+        padded = self._as_padded(paths)
+        n_paths, width = padded.shape
+        n = len(self._node_delay)
+
+        hops = (padded >= 0).sum(axis=1) - 1
+        valid = hops >= 1
+        in_range = (padded < n).all(axis=1)
+        valid &= in_range
+
+        total_delay = np.zeros(n_paths)
+        total_rel_cost = np.zeros(n_paths)
+        total_res_cost = np.zeros(n_paths)
+        total_reliability = np.ones(n_paths)
+        min_bandwidth = np.full(n_paths, np.inf)
+        has_zero = np.zeros(n_paths, dtype=bool)
+
+        for i in range(width - 1):
+            u, v = np.clip(padded[:, i], 0, n - 1), padded[:, i + 1]
+            hop = (v >= 0) & in_range
+            if not hop.any():
+                break
+
+            keys = np.where(hop, u * n + v, 0)
+            pos = np.minimum(np.searchsorted(self._edge_keys, keys),
+                             len(self._edge_keys) - 1)
+            e = self._edge_key_ids[pos]
+            found = (self._edge_keys[pos] == keys) & self.edge_active[e]
+            valid &= found | ~hop
+            hop &= found
+
+            # 1. Gecikme (Link + İşlem)
+            total_delay += np.where(hop, self.edge_delay[e], 0.0)
+            # 2. Güvenilirlik (-log ile toplamsal hale getirme)
+            total_rel_cost += np.where(hop, self._edge_rel_cost[e], 0.0)
+            total_reliability *= np.where(hop, self._edge_rel_factor[e], 1.0)
+            has_zero |= hop & (self.edge_reliability[e] <= 0)
+            if i > 0:
+                total_delay += np.where(hop, self._node_delay[u], 0.0)
+                total_rel_cost += np.where(hop, self._node_rel_cost[u], 0.0)
+                total_reliability *= np.where(hop, self._node_rel_factor[u], 1.0)
+                has_zero |= hop & (self._node_reliability[u] <= 0)
+            # 3. Kaynak Kullanımı (1000/Bant Genişliği)
+            total_res_cost += np.where(hop, self._edge_res_cost[e], 0.0)
+            min_bandwidth = np.minimum(min_bandwidth, np.where(hop, self._edge_min_bw[e], np.inf))
+
+        weighted_cost = profile.weighted(total_delay, total_rel_cost, total_res_cost)
+
+        return {
+            'score': weighted_cost,
+            'delay': total_delay,
+            'rel_cost': total_rel_cost,
+            'res_cost': total_res_cost,
+            'bandwidth': min_bandwidth,
+            'reliability': total_reliability,
+            'has_zero': has_zero,
+            'hops': hops,
+            'valid': valid,
+        }
+
+    def _score_path(self, path, profile):
+        """
+        Tek bir yolu skorlar (yuvarlama yapılmaz). _score_paths ile aynı
+        önceden hesaplanmış değerleri aynı sırada toplar; kısa yollarda
+        NumPy ek yükünden kaçınmak için saf Python ile çalışır.
+
+        Dönüş: (score, delay, min_bw, reliability, has_zero, res_cost) veya
+               olmayan bir kenar varsa KeyError.
+        """
+        csr = self._base_csr
+        total_delay = 0
+        total_rel_cost = 0
+        total_res_cost = 0
+        total_reliability = 1.0
+        min_bandwidth = float('inf')
+        has_zero = False
+
+        for i in range(len(path) - 1):
+            u = path[i]
+            eid = self._slot_edge_ids[csr.slot_of(u, path[i+1])]
+            if not self.edge_active[eid]:
+                raise KeyError((u, path[i+1]))
+            e_delay, e_rel_cost, e_rel_factor, e_res_cost, e_min_bw, e_zero = self._edge_terms[eid]
+
+            # 1. Gecikme (Link + İşlem)
+            total_delay += e_delay
+            # 2. Güvenilirlik (-log ile toplamsal hale getirme)
+            total_rel_cost += e_rel_cost
+            total_reliability *= e_rel_factor
+            has_zero = has_zero or e_zero
+            if i > 0:
+                n_delay, n_rel_cost, n_rel_factor, n_zero = self._node_terms[u]
+                total_delay += n_delay
+                total_rel_cost += n_rel_cost
+                total_reliability *= n_rel_factor
+                has_zero = has_zero or n_zero
+            # 3. Kaynak Kullanımı (1000/Bant Genişliği)
+            total_res_cost += e_res_cost
+            if e_min_bw < min_bandwidth:
+                min_bandwidth = e_min_bw
+
+        weighted_cost = profile.weighted(total_delay, total_rel_cost, total_res_cost)
+        return weighted_cost, total_delay, min_bandwidth, total_reliability, has_zero, total_res_cost
+
+    def calculate_costs(self, paths, profile=None):
+        """
+        Birden çok yolu tek seferde (vektörel) skorlar.
+
+        paths: Yol listesi (farklı uzunluklarda olabilir) veya -1 ile
+               dolgulu (n_yol x uzunluk) tamsayı matrisi.
+        profile: CostProfile (None ise config'deki varsayılan ağırlıklar).
+
+        Dönüş: {
+            'score': ndarray,         # Ağırlıklı toplam maliyet
+            'delay': ndarray,         # Toplam gecikme (ms)
+            'bandwidth': ndarray,     # Minimum bant genişliği (Mbps)
+            'reliability': ndarray,   # Toplam güvenilirlik (0-1 arası)
+            'rel_cost': ndarray,      # Güvenilirlik maliyeti (-log, toplamsal)
+            'resource': ndarray,      # Kaynak kullanımı (1000/BW toplamı)
+            'hops': ndarray           # Atlama sayısı
+        }
+        Değerler calculate_cost ile birebir aynıdır (aynı yuvarlama dahil).
+        Geçersiz yollar için score/delay/rel_cost/resource = inf,
+        bandwidth/reliability = 0 olur.
+        """
+        raw = self._score_paths(paths, CostProfile.of(profile))
+        valid = raw['valid']
+
+        score = np.array([round(x, 4) for x in raw['score'].tolist()])
+        delay = np.array([round(x, 2) for x in raw['delay'].tolist()])
+        reliability = np.array([round(x, 5) for x in raw['reliability'].tolist()])
+        resource = np.array([round(x, 4) for x in raw['res_cost'].tolist()])
+        bandwidth = np.where(np.isinf(raw['bandwidth']), 0, raw['bandwidth']).astype(np.int64)
+
+        return {
+            'score': np.where(valid, score, np.inf),
+            'delay': np.where(valid, delay, np.inf),
+            'bandwidth': np.where(valid, bandwidth, 0),
+            'reliability': np.where(valid, reliability, 0.0),
+            'rel_cost': np.where(valid, raw['rel_cost'], np.inf),
+            'resource': np.where(valid, resource, np.inf),
+            'hops': np.maximum(raw['hops'], 0),
+        }
+
+    def calculate_cost(self, path, profile=None):
         """
         Verilen yolun toplam ağırlıklı maliyetini ve detaylarını hesaplar.
         Formül: W_delay * Gecikme + W_rel * Güven_Maliyeti + W_res * Kaynak_Maliyeti
+        Ağırlıklar 'profile' (CostProfile) ile verilir; None ise config varsayılanları.
         
         Dönüş: {
             'score': float,           # Ağırlıklı toplam maliyet
@@ -53,76 +585,43 @@ class NetworkModel:
                 'reliability': 0
             }
 
-        total_delay = 0
-        total_rel_cost = 0
-        total_res_cost = 0
-        total_reliability = 1.0
-        min_bandwidth = float('inf')
-
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            edge = self.graph[u][v]
-            
-            # 1. Gecikme (Link + İşlem)
-            total_delay += edge['link_delay']
-            if i > 0:
-                total_delay += self.graph.nodes[u]['proc_delay']
-            
-            # 2. Güvenilirlik (-log ile toplamsal hale getirme)
-            if edge['reliability'] > 0:
-                total_rel_cost += -math.log(edge['reliability'])
-                total_reliability *= edge['reliability']
-            if i > 0 and self.graph.nodes[u]['reliability'] > 0:
-                total_rel_cost += -math.log(self.graph.nodes[u]['reliability'])
-                total_reliability *= self.graph.nodes[u]['reliability']
+        try:
+            score, delay, min_bandwidth, reliability, _, _ = \
+                self._score_path(path, CostProfile.of(profile))
+        except (KeyError, IndexError):
+            return self.calculate_cost(None)
 
-            # 3. Kaynak Kullanımı (1000/Bant Genişliği)
-            if edge['bandwidth'] > 0:
-                total_res_cost += (1000.0 / edge['bandwidth'])
-                if edge['bandwidth'] < min_bandwidth:
-                    min_bandwidth = edge['bandwidth']
-
-        weighted_cost = (W_DELAY * total_delay) + \
-                        (W_RELIABILITY * total_rel_cost) + \
-                        (W_RESOURCE * total_res_cost)
-        
         return {
-            'score': round(weighted_cost, 4),
-            'delay': round(total_delay, 2),
+            'score': round(score, 4),
+            'delay': round(delay, 2),
             'bandwidth': int(min_bandwidth) if min_bandwidth != float('inf') else 0,
-            'reliability': round(total_reliability, 5)
+            'reliability': round(reliability, 5)
         }
 
-    def calculate_metrics(self, path):
+    def calculate_metrics(self, path, profile=None):
         """
         Yolun ham metriklerini (Gecikme, Güvenilirlik, Maliyet) hesaplar.
         Pareto analizi ve raporlama için kullanılır.
         
-        Dönüş: {'cost': float, 'delay': float, 'reliability': float, 'hops': int}
+        Dönüş: {'cost': float, 'delay': float, 'reliability': float,
+                'resource': float, 'hops': int}
         """
         if not path: return None
-        
-        total_delay = 0
-        total_reliability = 1.0
-        
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            edge = self.graph[u][v]
-            
-            # Gecikme
-            total_delay += edge['link_delay']
-            if i > 0:
-                total_delay += self.graph.nodes[u]['proc_delay']
-                
-            # Güvenilirlik (Çarpımsal)
-            total_reliability *= edge['reliability']
-            if i > 0:
-                total_reliability *= self.graph.nodes[u]['reliability']
-                
+        if len(path) < 2:
+            return {'cost': float('inf'), 'delay': 0, 'reliability': 1.0, 'resource': 0, 'hops': 0}
+
+        # Tek geçiş: maliyet ve ham metrikler aynı skorlamadan gelir
+        score, delay, _, reliability, has_zero, resource = \
+            self._score_path(path, CostProfile.of(profile))
+        # Ham güvenilirlikte 0 değerli bileşenler de çarpıma girer
+        if has_zero:
+            reliability = 0.0
+
         return {
-            'cost': self.calculate_cost(path)['score'],
-            'delay': round(total_delay, 2),
-            'reliability': round(total_reliability, 5),
+            'cost': round(score, 4),
+            'delay': round(delay, 2),
+            'reliability': round(reliability, 5),
+            'resource': round(resource, 4),
             'hops': len(path) - 1
         }
 
@@ -144,15 +643,409 @@ class NetworkModel:
                 
         return int(min_bw) if min_bw != float('inf') else None
 
+    def _cached(self, cache, key, build, max_size, stats=None):
+        """
+        Küçük, thread-safe LRU önbellek yardımcısı: anahtar varsa döndürür,
+        yoksa build() ile oluşturup ekler ve en eski kayıtları atar.
+        """
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+                if stats is not None:
+                    stats['hits'] += 1
+                return value
+            if stats is not None:
+                stats['misses'] += 1
+
+        value = build()
+
+        with self._lock:
+            cache[key] = value
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+        return value
+
+    def _bandwidth_cut(self, min_bw):
+        """
+        Bant genişliği indeksinde eşiğin kesim noktası: bw >= min_bw olan
+        kenarlar _bw_order[cut:] dilimidir. Aynı kenar kümesini veren tüm
+        eşikler aynı kesim noktasına (dolayısıyla aynı önbellek kaydına) düşer.
+        """
+        if min_bw <= 0:
+            return 0
+        return int(np.searchsorted(self._bw_sorted, min_bw, side='left'))
+
+    def _bandwidth_edge_mask(self, cut):
+        """Kesim noktasındaki (bw >= eşik) kenarların maskesi (kenar ID başına)."""
+        mask = np.zeros(len(self.edge_src), dtype=bool)
+        mask[self._bw_order[cut:]] = True
+        return mask
+
     def get_filtered_graph(self, min_bw):
         """
         Belirtilen bant genişliği (min_bw) altındaki linkleri budanmış 
-        yeni bir graf (View) döndürür.
+        yeni bir graf döndürür.
+
+        Graf, bant genişliği indeksiyle bir kez somutlaştırılır (materialize)
+        ve eşik başına önbellekte tutulur; komşu gezinmesi filtresiz grafla
+        aynı maliyettedir (kenar başına filtre fonksiyonu çağrılmaz).
         """
-        if min_bw <= 0:
+        cut = self._bandwidth_cut(min_bw)
+        if cut == 0:
+            # Kapatılan linkler self.graph'tan zaten çıkarılır
             return self.graph
-            
-        def filter_edge(u, v):
-            return self.graph[u][v].get('bandwidth', 0) >= min_bw
-            
-        return nx.subgraph_view(self.graph, filter_edge=filter_edge)
\ No newline at end of file
+
+        def build():
+            eids = self._bw_order[cut:]
+            eids = eids[self.edge_active[eids]]
+            graph = nx.Graph()
+            graph.add_nodes_from(self.graph.nodes(data=True))
+            graph.add_edges_from(
+                (u, v, self.graph[u][v])
+                for u, v in zip(self.edge_src[eids].tolist(), self.edge_dst[eids].tolist()))
+            return graph
+
+        return self._cached(self._filtered_graphs, cut, build, FILTER_CACHE_SIZE)
+
+    def get_csr(self, min_bw=0):
+        """
+        Grafın CSR görünümünü döndürür. min_bw > 0 ise sadece bant genişliği
+        yeterli (>= min_bw) olan kenarlar dahil edilir. Filtrelenmiş görünümler
+        eşik başına önbellekte tutulur. Kapatılmış (remove_edge) linkler dahil edilmez.
+        """
+        cut = self._bandwidth_cut(min_bw)
+        if cut == 0 and self.edge_active.all():
+            return self._base_csr
+
+        def build():
+            mask = self._bandwidth_edge_mask(cut) & self.edge_active
+            return self._base_csr.subgraph(mask[self._base_csr.edge_ids])
+
+        return self._cached(self._filtered_csrs, cut, build, FILTER_CACHE_SIZE)
+
+    def _build_csr(self):
+        """Tüm kenarlardan (iki yönlü) filtresiz CSR yapısını kurar."""
+        n = int(self.node_ids.max()) + 1 if len(self.node_ids) else 0
+        eids = np.arange(len(self.edge_src))
+        src, dst = self.edge_src, self.edge_dst
+
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        slot_eids = np.concatenate([eids, eids])
+
+        order = np.lexsort((cols, rows))
+        rows, cols, slot_eids = rows[order], cols[order], slot_eids[order]
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        proc_delay = np.full(n, np.nan)
+        node_reliability = np.full(n, np.nan)
+        proc_delay[self.node_ids] = self.node_proc_delay
+        node_reliability[self.node_ids] = self.node_reliability
+
+        return CSRGraph(indptr, cols, slot_eids,
+                        self.edge_bandwidth[slot_eids],
+                        self.edge_delay[slot_eids],
+                        self.edge_reliability[slot_eids],
+                        proc_delay, node_reliability)
+
+    def get_cost_table(self, profile=None):
+        """
+        Verilen ağırlık profili için ağırlıklı maliyet tablosunu döndürür.
+        Tablolar profil başına bir kez hesaplanır ve küçük bir LRU önbellekte
+        (COST_TABLE_CACHE_SIZE) tutulur; GUI'de aynı ağırlıklarla tekrarlanan
+        sorgular yeniden hesaplama yapmaz. Thread-safe'tir.
+
+        profile: CostProfile, (w_delay, w_reliability, w_resource) veya None
+        """
+        profile = CostProfile.of(profile)
+
+        def build():
+            return CostTable(
+                profile,
+                step=profile.weighted(self._slot_step_delay, self._slot_rel_cost, self._slot_res_cost),
+                edge=profile.weighted(self.edge_delay, self._edge_rel_cost, self._edge_res_cost),
+                node=(profile.w_delay * self._node_delay) + (profile.w_reliability * self._node_rel_cost))
+
+        return self._cached(self._cost_tables, profile, build, COST_TABLE_CACHE_SIZE,
+                            self.cost_table_stats)
+
+    def get_step_costs(self, csr, profile=None):
+        """Verilen CSR görünümünün yuvaları için RL adım maliyetlerini döndürür."""
+        return self.get_cost_table(profile).step[csr.full_slots]
+
+    def get_next_hop_tree(self, dst, min_bw=0, profile=None):
+        """
+        dst kökenli ters en kısa yol ağacını döndürür: next_hop[v], v'den dst'ye
+        giden yoldaki bir sonraki düğümdür (dst ve ulaşılamayan düğümler: -1).
+        Herhangi bir düğümden dst'ye yol, işaretçi takibiyle O(yol uzunluğu)
+        sürede çıkarılır.
+
+        profile None ise en az atlamalı (BFS) ağaç, verilirse o profilin
+        ağırlıklı maliyetine göre (Dijkstra) ağaç kurulur. Ağaçlar
+        (dst, BW kesim noktası, profil) başına önbellekte tutulur ve
+        topoloji güncellemelerinde atılır.
+        """
+        return self._tree_to(dst, min_bw, profile)[1]
+
+    def get_distances_to(self, dst, min_bw=0, profile=None):
+        """
+        Her düğümden dst'ye kalan mesafe (ulaşılamayan: inf): profile None ise
+        atlama sayısı, verilirse ağırlıklı maliyet. get_next_hop_tree ile aynı
+        önbellek kaydını paylaşır.
+        """
+        return self._tree_to(dst, min_bw, profile)[0]
+
+    def _tree_to(self, dst, min_bw, profile):
+        """dst kökenli (dist, next_hop) ağacı; bkz. get_next_hop_tree."""
+        csr = self.get_csr(min_bw)
+        if profile is not None:
+            profile = CostProfile.of(profile)
+        key = (dst, self._bandwidth_cut(min_bw), profile)
+
+        def build():
+            if profile is None:
+                return csr.bfs_tree(dst)
+            from .dijkstra_solver import shortest_path_tree
+
+            table = self.get_cost_table(profile)
+            return shortest_path_tree(csr, table.edge[csr.edge_ids].tolist(),
+                                      table.node.tolist(), dst)
+
+        return self._cached(self._next_hop_trees, key, build, NEXT_HOP_CACHE_SIZE)
+
+    # ------------------------------------------------------------------
+    # Artımlı (incremental) topoloji güncellemeleri
+    # ------------------------------------------------------------------
+    def _edge_id(self, u, v):
+        """(u, v) linkinin kararlı kenar ID'si (kapatılmış linkler dahil)."""
+        return self._slot_edge_ids[self._base_csr.slot_of(u, v)]
+
+    def _edge_state(self, eid):
+        """Önbellek geçersizleştirme kararları için linkin o anki durumu."""
+        return (bool(self.edge_active[eid]), float(self.edge_bandwidth[eid]),
+                float(self.edge_delay[eid]), float(self._edge_rel_cost[eid]),
+                float(self._edge_res_cost[eid]))
+
+    def update_edge(self, u, v, bandwidth=None, link_delay=None, reliability=None):
+        """
+        Bir linkin özelliklerini yerinde günceller (yeniden yükleme olmadan).
+
+        Graf, tüm türetilmiş diziler ve önbellekteki maliyet tabloları yama
+        ile güncellenir; sadece etkilenen BW filtreleri ve rotalar
+        geçersizleştirilir.
+        """
+        with self._lock:
+            eid = self._edge_id(u, v)
+            before = self._edge_state(eid)
+
+            if bandwidth is not None:
+                self.edge_bandwidth[eid] = bandwidth
+            if link_delay is not None:
+                self.edge_delay[eid] = link_delay
+            if reliability is not None:
+                self.edge_reliability[eid] = reliability
+            self._refresh_edge(eid)
+
+            if bandwidth is not None and bandwidth != before[1]:
+                self._move_in_bandwidth_index(eid)
+
+            self._after_edge_change(eid, before)
+
+    def remove_edge(self, u, v):
+        """Linki kapatır (arıza); özellikleri restore_edge için saklanır."""
+        with self._lock:
+            eid = self._edge_id(u, v)
+            if not self.edge_active[eid]:
+                return
+            before = self._edge_state(eid)
+            self.edge_active[eid] = False
+            self._after_edge_change(eid, before)
+
+    def restore_edge(self, u, v):
+        """remove_edge ile kapatılan linki son özellikleriyle geri açar."""
+        with self._lock:
+            eid = self._edge_id(u, v)
+            if self.edge_active[eid]:
+                return
+            before = self._edge_state(eid)
+            self.edge_active[eid] = True
+            self._after_edge_change(eid, before)
+
+    def update_node(self, node, proc_delay=None, reliability=None):
+        """Bir düğümün işlem gecikmesini ve/veya güvenilirliğini yerinde günceller."""
+        with self._lock:
+            csr = self._base_csr
+            before = (float(self._node_delay[node]), float(self._node_rel_cost[node]))
+
+            # _node_delay / _node_reliability tüm CSR görünümleriyle paylaşılan dizilerdir
+            if proc_delay is not None:
+                self._node_delay[node] = proc_delay
+            if reliability is not None:
+                self._node_reliability[node] = reliability
+            r = float(self._node_reliability[node])
+            self._node_rel_cost[node] = -math.log(r) if r > 0 else 0.0
+            self._node_rel_factor[node] = r if r > 0 else 1.0
+            self._node_terms[node] = (float(self._node_delay[node]), float(self._node_rel_cost[node]),
+                                      float(self._node_rel_factor[node]), r <= 0)
+
+            idx = np.flatnonzero(self.node_ids == node)
+            self.node_proc_delay[idx] = self._node_delay[node]
+            self.node_reliability[idx] = r
+            attrs = {'proc_delay': float(self._node_delay[node]), 'reliability': r}
+            # Henüz kurulmamış graf yamanmaz (kurulduğunda dizilerden okunur)
+            for graph in [g for g in (self._graph, *self._filtered_graphs.values()) if g is not None]:
+                graph.nodes[node].update(attrs)
+
+            # Düğümden çıkan yuvaların RL adım maliyetleri
+            out = slice(csr.indptr[node], csr.indptr[node + 1])
+            self._slot_step_delay[out] = csr.link_delay[out] + self._node_delay[node]
+            for profile, table in self._cost_tables.items():
+                table.node[node] = (profile.w_delay * self._node_delay[node]) + \
+                                   (profile.w_reliability * self._node_rel_cost[node])
+                table.step[out] = profile.weighted(self._slot_step_delay[out],
+                                                   self._slot_rel_cost[out],
+                                                   self._slot_res_cost[out])
+
+            if self.route_table is not None:
+                for key in list(self.route_table.predecessors):
+                    profile = key[0]
+                    old = (profile.w_delay * before[0]) + (profile.w_reliability * before[1])
+                    new = (profile.w_delay * self._node_delay[node]) + \
+                          (profile.w_reliability * self._node_rel_cost[node])
+                    if new > old:
+                        self.route_table.mark_stale(key, node=node)
+                    elif new < old:
+                        self.route_table.mark_stale(key)
+
+            self._next_hop_trees.clear()
+            self.topology_version += 1
+
+    def _refresh_edge(self, eid):
+        """Tek bir linkin türetilmiş değerlerini (diziler, CSR yuvaları, tablolar) yeniler."""
+        bw = float(self.edge_bandwidth[eid])
+        rel = float(self.edge_reliability[eid])
+        self._edge_rel_cost[eid] = -math.log(rel) if rel > 0 else 0.0
+        self._edge_rel_factor[eid] = rel if rel > 0 else 1.0
+        self._edge_res_cost[eid] = 1000.0 / bw if bw > 0 else 0.0
+        self._edge_min_bw[eid] = bw if bw > 0 else np.inf
+        self._edge_terms[eid] = (float(self.edge_delay[eid]), float(self._edge_rel_cost[eid]),
+                                 float(self._edge_rel_factor[eid]), float(self._edge_res_cost[eid]),
+                                 float(self._edge_min_bw[eid]), rel <= 0)
+
+        slots = self._edge_slots[eid]
+        csr = self._base_csr
+        for view in [csr, *self._filtered_csrs.values()]:
+            # Görünümdeki yuvalar: full_slots sıralı olduğundan ikili arama ile bulunur
+            pos = np.minimum(np.searchsorted(view.full_slots, slots), view.num_slots - 1)
+            pos = pos[view.full_slots[pos] == slots]
+            view.bandwidth[pos] = bw
+            view.link_delay[pos] = self.edge_delay[eid]
+            view.link_reliability[pos] = rel
+
+        self._slot_step_delay[slots] = csr.link_delay[slots] + self._node_delay[csr.slot_src[slots]]
+        self._slot_rel_cost[slots] = self._edge_rel_cost[eid]
+        self._slot_res_cost[slots] = self._edge_res_cost[eid]
+        for profile, table in self._cost_tables.items():
+            table.edge[eid] = profile.weighted(self.edge_delay[eid], self._edge_rel_cost[eid],
+                                               self._edge_res_cost[eid])
+            table.step[slots] = profile.weighted(self._slot_step_delay[slots],
+                                                 self._slot_rel_cost[slots],
+                                                 self._slot_res_cost[slots])
+
+    def _move_in_bandwidth_index(self, eid):
+        """BW değişen linki sıralı indekste yeni yerine taşır (O(E) kaydırma)."""
+        old_pos = int(self._bw_pos[eid])
+        order = np.delete(self._bw_order, old_pos)
+        values = np.delete(self._bw_sorted, old_pos)
+        new_pos = int(np.searchsorted(values, self.edge_bandwidth[eid], side='right'))
+        self._bw_order = np.insert(order, new_pos, eid)
+        self._bw_sorted = np.insert(values, new_pos, self.edge_bandwidth[eid])
+
+        lo, hi = min(old_pos, new_pos), max(old_pos, new_pos)
+        self._bw_pos[self._bw_order[lo:hi + 1]] = np.arange(lo, hi + 1)
+
+        # Sadece kesim noktası iki konum arasında kalan filtrelerin kenar kümesi değişir
+        for cache in (self._filtered_csrs, self._filtered_graphs):
+            for cut in [c for c in cache if lo < c <= hi]:
+                del cache[cut]
+
+    def _after_edge_change(self, eid, before):
+        """
+        Link değişikliği sonrası hedefli geçersizleştirme:
+        - nx grafları (ana, kurulmuşsa, + önbellekteki filtreler) yerinde yamanır,
+        - kapatılan/açılan link için onu içeren CSR filtreleri atılır,
+        - rota tablosunda sadece etkilenebilecek kaynak satırları eskitilir.
+        """
+        u, v = int(self.edge_src[eid]), int(self.edge_dst[eid])
+        active = bool(self.edge_active[eid])
+        attrs = {'bandwidth': float(self.edge_bandwidth[eid]),
+                 'link_delay': float(self.edge_delay[eid]),
+                 'reliability': float(self.edge_reliability[eid])}
+        pos = int(self._bw_pos[eid])
+
+        # nx grafları: cut <= pos olan filtreler linki içermelidir
+        for cut, graph in [(0, self._graph), *self._filtered_graphs.items()]:
+            if graph is None:
+                continue
+            if active and cut <= pos:
+                if graph.has_edge(u, v):
+                    graph[u][v].update(attrs)
+                else:
+                    graph.add_edge(u, v, **attrs)
+            elif graph.has_edge(u, v):
+                graph.remove_edge(u, v)
+
+        # CSR yapısı değiştiyse (link açıldı/kapandı) onu içeren filtreler yeniden kurulur
+        if active != before[0]:
+            for cut in [c for c in self._filtered_csrs if c <= pos]:
+                del self._filtered_csrs[cut]
+
+        if self.route_table is not None:
+            after = self._edge_state(eid)
+            for key in list(self.route_table.predecessors):
+                profile, bw_class = key
+                was_in = before[0] and before[1] >= bw_class
+                is_in = after[0] and after[1] >= bw_class
+                if was_in and is_in:
+                    old = profile.weighted(*before[2:])
+                    new = profile.weighted(*after[2:])
+                    if new > old:
+                        self.route_table.mark_stale(key, edge=(u, v))
+                    elif new < old:
+                        self.route_table.mark_stale(key)
+                elif was_in:
+                    self.route_table.mark_stale(key, edge=(u, v))
+                elif is_in:
+                    self.route_table.mark_stale(key)
+
+        self._next_hop_trees.clear()
+        self.topology_version += 1
+
+    def build_route_table(self, bw_classes=ROUTE_TABLE_BW_CLASSES, profiles=None, workers=None):
+        """
+        Tüm (kaynak, hedef) çiftleri için her BW sınıfı ve ağırlık profilinde
+        optimal rotaları önceden hesaplar (bkz. route_table.RouteTable).
+        Hesaplama kaynak düğümlere göre süreçlere bölünür.
+
+        Tablo self.route_table olarak saklanır; sorgular:
+            model.route_table.lookup(src, dst, min_bw, profile)
+        """
+        from .route_table import RouteTable
+
+        self.route_table = RouteTable.build(self, bw_classes, profiles, workers)
+        print(f"[INFO] Rota tablosu hazır: {len(self.route_table.predecessors)} "
+              f"(profil, BW sınıfı), {self.route_table.nbytes / 1024:.0f} KB")
+        return self.route_table
+
+    def load_route_table(self, file):
+        """
+        Diske kaydedilmiş rota tablosunu okur ve self.route_table olarak saklar.
+        Tablo bu topoloji için kaydedilmemişse ValueError fırlatır.
+        """
+        from .route_table import RouteTable
+
+        self.route_table = RouteTable.load(self, file)
+        return self.route_table
@@ -1,7 +1,162 @@
+import os
 import random
-import math
-from src.config import RL_EPISODES, RL_ALPHA, RL_GAMMA, RL_EPSILON
-from src.config import W_DELAY, W_RELIABILITY, W_RESOURCE 
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from src.config import (RL_EPISODES, RL_ALPHA, RL_GAMMA, RL_EPSILON, RL_BATCH_SIZE,
+                        RL_CACHE_SIZE, RL_CACHE_ANY_SOURCE, RL_WARM_EPISODES,
+                        RL_STABLE_PROBES, RL_Q_TOLERANCE, RL_Q_INIT, RL_SHAPING, RL_ACTION_MASK)
+from src.network_model import CostProfile
+from src.dijkstra_solver import shortest_path_tree
+
+
+class QTableCache:
+    """
+    Eğitilmiş Q-Tablolarını (hedef, BW kesimi, ağırlık profili) anahtarıyla
+    tutan sınırlı LRU depo.
+
+    Aynı sorgu tekrarlandığında (deney tekrarları, GUI'de yeniden çözüm)
+    tablo devralınır ve eğitim kısa bir bölümle sürdürülür (RL_WARM_EPISODES,
+    0 -> atlanır). Aynı kenar kümesini veren BW talepleri aynı kaydı paylaşır.
+    Topoloji güncellenince (model.topology_version) kayıtlar geçersiz sayılır.
+
+    Tablo her durumdan dst'ye giden rotaları kodlasa da, ödül src'den
+    biriken maliyete göre (1000 / maliyet) verildiği için değerler kaynağa
+    bağlıdır: başka bir kaynağın tablosu açgözlü yolu eski rotaya çeker.
+    Bu yüzden varsayılan olarak anahtara src de eklenir (hedef başına her
+    kaynak kendi kaydını tutar); any_source=True ile (RL_CACHE_ANY_SOURCE)
+    hedef başına tek kayıt tutulur ve farklı kaynaklar onu devralır.
+
+    directory verilirse tablolar .npz olarak diske de yazılır ve bellekte
+    bulunmayan kayıtlar oradan okunur (çalıştırmalar arası yeniden kullanım).
+    Thread-safe'tir (GUI çözümleri ayrı thread'lerde çalışır).
+    """
+    def __init__(self, max_size=RL_CACHE_SIZE, directory=None, any_source=RL_CACHE_ANY_SOURCE):
+        self.max_size = max_size
+        self.directory = directory
+        self.any_source = any_source
+        self._store = OrderedDict()  # anahtar -> (topology_version, src, q_table)
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'disk_hits': 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, solver):
+        """
+        (dst, BW kesimi, profil, şekillendirme, src); any_source=True ise src yerine None.
+        Şekillendirilmiş tablo Q* - Φ(s) tuttuğundan şekillendirmesiz tabloyla paylaşılamaz.
+        """
+        return (solver.dst, solver.model._bandwidth_cut(solver.min_bw), solver.profile,
+                bool(solver.shaping), None if self.any_source else solver.src)
+
+    def _file(self, key):
+        dst, cut, profile, shaping, src = key
+        weights = '_'.join(f'{w:g}' for w in profile)
+        shaped = '_shaped' if shaping else ''
+        source = '' if src is None else f'_s{src}'
+        return os.path.join(self.directory, f'q_{dst}_{cut}_{weights}{shaped}{source}.npz')
+
+    def _insert(self, key, entry):
+        """Kaydı en yeni olarak ekler ve LRU sınırını uygular (kilit altında çağrılır)."""
+        self._store[key] = entry
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
+
+    def get(self, solver):
+        """Çözücünün sorgusu için saklanan Q-Tablosunun kopyası (yoksa None)."""
+        key = self.key(solver)
+        version = solver.model.topology_version
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry[0] != version:
+                del self._store[key]
+                entry = None
+            from_disk = False
+            if entry is None and self.directory and os.path.exists(self._file(key)):
+                try:
+                    entry = (version,) + solver.read_q_table(self._file(key))
+                    from_disk = True
+                except ValueError:
+                    entry = None
+            if entry is None or (entry[1] != solver.src and not self.any_source):
+                self.stats['misses'] += 1
+                return None
+            if from_disk:
+                self.stats['disk_hits'] += 1
+            self._insert(key, entry)
+            self.stats['hits'] += 1
+            return entry[2].copy()
+
+    def put(self, solver):
+        """Çözücünün eğitilmiş Q-Tablosunu saklar (directory varsa diske de yazar)."""
+        key = self.key(solver)
+        with self._lock:
+            self._insert(key, (solver.model.topology_version, solver.src, solver.q_table.copy()))
+            if self.directory:
+                solver.save_q_table(self._file(key))
+
+    def summary(self):
+        """İsabet sayıları ve oranı."""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(self.stats, hit_rate=self.stats['hits'] / lookups if lookups else 0.0)
+
+
+class _ConvergenceMonitor:
+    """
+    İlerleme ölçümleri (probe) ve erken durdurma kontrolü; train() ve
+    train_batched() tarafından ortak kullanılır.
+
+    Her ölçümde açgözlü yol çıkarılır; yol bir önceki ölçümle aynıysa
+    maliyeti yeniden hesaplanmaz. Durma nedenleri:
+    - 'stable_path': Geçerli açgözlü yol stable_probes ölçüm boyunca değişmedi
+    - 'q_tolerance': Yol değişmedi ve yol üzerindeki Q değerlerinin iki ölçüm
+      arasındaki göreli değişimi (max |ΔQ| / max |Q|) q_tolerance'ın altında kaldı.
+      Keşif (epsilon) yol dışındaki değerleri sürekli oynattığı için tüm tablo
+      yerine açgözlü yolun yuvalarına bakılır.
+    - 'deadline':    Süre bütçesi doldu
+    """
+    def __init__(self, solver, stable_probes, q_tolerance, deadline_ms):
+        self.solver = solver
+        self.stable_probes = stable_probes
+        self.q_tolerance = q_tolerance
+        self.deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
+        self.history = []
+        self.path = None
+        self.cost = float('inf')
+        self.stable = 0
+        self.slots = None   # Açgözlü yolun Q yuvaları
+        self.path_q = None  # Önceki ölçümde bu yuvaların Q değerleri
+
+    def expired(self):
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def probe(self):
+        """Açgözlü yolu ölçüp history'ye ekler; durulması gerekiyorsa nedenini döndürür."""
+        solver = self.solver
+        path = solver.get_path()
+        if path == self.path:
+            self.stable += 1
+        else:
+            self.path, self.stable = path, 0
+            self.cost = solver.model.calculate_cost(path, solver.profile)['score']
+            self.slots = [solver.csr.slot_of(u, v) for u, v in zip(path, path[1:])]
+        # Sonsuz maliyetleri grafikte göstermemek için 0 yazılır
+        self.history.append(self.cost if self.cost != float('inf') else 0)
+
+        if self.stable_probes and self.stable >= self.stable_probes and self.cost != float('inf'):
+            return 'stable_path'
+        if self.q_tolerance and self.cost != float('inf'):
+            path_q = solver.q_table[self.slots]
+            if self.stable:
+                delta = np.abs(path_q - self.path_q).max() / max(np.abs(path_q).max(), 1e-12)
+                if delta < self.q_tolerance:
+                    return 'q_tolerance'
+            self.path_q = path_q
+        return 'deadline' if self.expired() else None
+
 
 class QLearningSolver:
     """
@@ -12,70 +167,238 @@ class QLearningSolver:
     - Her adımda bir ödül veya ceza alır.
     - Q-Tablosu (Q-Table) zamanla 'hangi durumda hangi hareket kazançlı' bilgisini öğrenir.
     - Hedef: Toplam ödülü maksimize (Maliyeti minimize) etmek.
+
+    q_init: 'zero' (Q = 0) veya 'heuristic' (en kısa yol maliyetlerinden, bkz. heuristic_q)
+    shaping: Potansiyel tabanlı ödül şekillendirme, Φ(s) = max_a Q0(s, a):
+             r' = r + gamma * Φ(s') - Φ(s). Optimal politikayı değiştirmez.
+    action_mask: Eğitimde ve yol çıkarmada sadece bölümde ziyaret edilmemiş
+                 ve dst'ye ulaşabilen komşular aday eylemdir. Linkler yönsüz
+                 olduğundan src'nin bileşenindeki her düğüm dst'ye ulaşır;
+                 budamayı fiilen yapan kısım tekrar ziyaret yasağıdır.
     """
-    def __init__(self, network_model, src, dst, min_bw=0):
+    def __init__(self, network_model, src, dst, min_bw=0, profile=None, q_cache=None,
+                 q_init=RL_Q_INIT, shaping=RL_SHAPING, action_mask=RL_ACTION_MASK):
         self.model = network_model
-        # BW Kısıtı: Filtrelenmiş graf (self.graph) üzerinden işlem yap
-        self.graph = network_model.get_filtered_graph(min_bw)
+        # Ağırlıklar eğitim boyunca sabit (değişmez profil; None -> config varsayılanı)
+        self.profile = CostProfile.of(profile)
+        # BW Kısıtı: Filtrelenmiş CSR görünümü (self.csr) üzerinden işlem yap
+        self.csr = network_model.get_csr(min_bw)
+        self.adj = self.csr.neighbor_lists()
+        # Yuva başına ağırlıklı adım maliyeti (O(1) erişim için liste)
+        self.step_costs = network_model.get_step_costs(self.csr, self.profile).tolist()
+        self.indptr = self.csr.indptr.tolist()
+        self.min_bw = min_bw
         self.src = src
         self.dst = dst
-        self.q_table = {} # Q(State, Action) -> Değer
+        # Q(State, Action) -> Değer: CSR yuvası başına yoğun (dense) dizi.
+        # s durumunun eylem değerleri q_table[indptr[s]:indptr[s+1]] dilimidir
+        # (komşu sırası self.adj[s] ile aynı); bellek = yuva sayısı x 8 byte.
+        if q_init == 'heuristic':
+            self.q_table = self.heuristic_q()
+            if shaping:
+                # Şekillendirilmiş uzayda karşılığı: Q0 - Φ(s)
+                self.q_table -= self.potential(self.q_table)[self.csr.slot_src]
+        elif q_init == 'zero':
+            self.q_table = np.zeros(self.csr.num_slots)
+        else:
+            raise ValueError(f"Bilinmeyen Q başlatma modu: {q_init}")
+        self.q_init = q_init
+        self.shaping = shaping
+        # dst'ye ulaşabilen düğümler ((dst, BW kesimi) başına modelde önbellekli BFS)
+        self.reachable = np.isfinite(network_model.get_distances_to(dst, min_bw)) if action_mask else None
+        self.q_cache = q_cache  # Opsiyonel QTableCache (aynı hedefe önceki eğitimler)
+        self.stats = {}  # Son eğitimin istatistikleri (bölüm ve adım sayısı)
+
+    def _step_tree(self, root):
+        """
+        root kökenli en kısa yol ağacı (RL adım maliyetleriyle): (dist, parent, node).
+
+        Adım maliyeti çıkılan düğümün işlem gecikmesini içerdiğinden bu terim
+        Dijkstra'ya düğüm terimi (node) olarak katlanır; dist uç düğümlerin
+        kendi terimlerini içermez.
+        """
+        csr = self.csr
+        node = np.nan_to_num(self.profile.w_delay * csr.proc_delay)
+        edge = np.asarray(self.step_costs) - node[csr.slot_src]
+        dist, parent = shortest_path_tree(csr, edge.tolist(), node.tolist(), root)
+        return np.array(dist), np.array(parent), node
+
+    def heuristic_q(self):
+        """
+        Sezgisel başlangıç Q-Tablosu (iki Dijkstra: dst'den ters, src'den ileri).
+
+        Q0(s, a) = gamma^d(a) * 1000 / (g(s) + adım(s, a) + h(a))
+          h(a): a'dan dst'ye en düşük adım maliyeti, d(a): o yoldaki atlama sayısı
+          g(s): src'den s'ye en düşük adım maliyeti
+
+        Terminal ödül src'den biriken maliyete göre verildiği için g(s) ve
+        indirim (gamma) olmadan değerler hedefe yaklaştıkça şişer; ziyaret
+        edilmemiş eylemler aşırı iyimser kalır ve ajan dolaşır. Bu biçimde
+        optimal yol üzerindeki değerler Q-Learning'in sabit noktasına yakındır.
+        dst'ye ulaşamayan eylemler ve dst'nin (terminal) eylemleri 0 alır.
+        """
+        csr = self.csr
+        dist, parent, node = self._step_tree(self.dst)
+        h = dist + node
+        h[self.dst] = 0.0
+        depth = np.zeros(csr.num_nodes, dtype=np.int64)
+        for v in np.argsort(dist).tolist():  # ebeveynler çocuklardan önce gelir
+            if parent[v] >= 0:
+                depth[v] = depth[parent[v]] + 1
+
+        fwd, _, _ = self._step_tree(self.src)
+        g = fwd + node[self.src]
+        g[self.src] = 0.0
+
+        a = csr.indices
+        total = g[csr.slot_src] + np.asarray(self.step_costs) + h[a]
+        q = np.zeros(csr.num_slots)
+        valid = np.isfinite(total) & (csr.slot_src != self.dst)
+        q[valid] = RL_GAMMA ** depth[a[valid]] * 1000.0 / total[valid]
+        return q
+
+    def potential(self, q0=None):
+        """Şekillendirme potansiyeli Φ(s) = max_a Q0(s, a) (dst ve ulaşılamayan: 0)."""
+        phi = np.zeros(self.csr.num_nodes)
+        np.maximum.at(phi, self.csr.slot_src, self.heuristic_q() if q0 is None else q0)
+        return phi
 
     def get_q(self, s, a):
         """Verilen durum ve eylem için Q değerini döndürür."""
-        return self.q_table.get((s, a), 0.0)
+        return float(self.q_table[self.csr.slot_of(s, a)])
+
+    def save_q_table(self, file):
+        """Q-Tablosunu (ve uyumluluk kontrolü için bağlamını) .npz dosyasına yazar."""
+        np.savez(file, q_table=self.q_table, src=self.src, dst=self.dst, min_bw=self.min_bw,
+                 profile=np.array(self.profile), full_slots=self.csr.full_slots,
+                 step_costs=np.asarray(self.step_costs), shaping=bool(self.shaping),
+                 q_init=self.q_init)
+
+    def read_q_table(self, file):
+        """
+        save_q_table ile yazılmış dosyadan (src, q_table) döndürür. Tablo aynı hedef, aynı
+        CSR görünümü (aynı yuvalar) ve aynı adım maliyetleri için
+        kaydedilmemişse ya da şekillendirme ayarı farklıysa (alan yoksa şekillendirmesiz
+        kabul edilir) ValueError fırlatır.
+        """
+        with np.load(file, allow_pickle=False) as data:
+            if int(data['dst']) != self.dst or \
+                    not np.array_equal(data['full_slots'], self.csr.full_slots) or \
+                    ('step_costs' in data.files and
+                     not np.array_equal(data['step_costs'], self.step_costs)) or \
+                    ('shaping' in data.files and bool(data['shaping'])) != bool(self.shaping):
+                raise ValueError(f"Q-Tablosu bu sorguyla uyumsuz: {file}")
+            src = int(data['src']) if 'src' in data.files else -1
+            return src, data['q_table'].copy()
+
+    def load_q_table(self, file):
+        """save_q_table ile yazılmış Q-Tablosunu okur (uyumsuzsa ValueError)."""
+        self.q_table = self.read_q_table(file)[1]
+
+    def _warm_start(self, episodes):
+        """
+        Önbellekte bu hedef için eğitilmiş tablo varsa onu devralır.
+        Dönüş: (sıcak başlatıldı mı, çalıştırılacak bölüm sayısı)
+        """
+        cached = self.q_cache.get(self) if self.q_cache is not None else None
+        if cached is not None:
+            self.q_table = cached
+        if episodes is None:
+            episodes = RL_WARM_EPISODES if cached is not None else RL_EPISODES
+        return cached is not None, episodes
+
+    def _finish(self, monitor, stats):
+        """Eğitim sonu: en az bir ölçüm, istatistikler ve önbelleğe yazma."""
+        if not monitor.history:
+            monitor.probe()
+        self.stats = stats
+        if self.q_cache is not None:
+            self.q_cache.put(self)
+        return monitor.history
+
+    def state_values(self):
+        """
+        V(s) = max_a Q(s, a) dizisi (komşusu olmayan düğümler: 0), tüm
+        Q-Tablosu üzerinden tek vektörel geçişte hesaplanır.
+        """
+        indptr = self.csr.indptr
+        values = np.zeros(self.csr.num_nodes)
+        nonempty = indptr[1:] > indptr[:-1]
+        if nonempty.any():
+            values[nonempty] = np.maximum.reduceat(self.q_table, indptr[:-1][nonempty])
+        return values
 
     def calculate_step_cost(self, u, v):
-        """Tek bir adımın (linkin) ağırlıklı maliyetini hesaplar."""
-        edge = self.graph[u][v]
-        
-        # 1. Gecikme (Link + Hedef Node İşlem)
-        delay = edge['link_delay'] + self.model.graph.nodes[u]['proc_delay']
-        
-        # 2. Güvenilirlik (-log)
-        rel_cost = 0
-        if edge['reliability'] > 0:
-            rel_cost += -math.log(edge['reliability'])
-        
-        # 3. Kaynak (1000/BW)
-        res_cost = 0
-        if edge['bandwidth'] > 0:
-            res_cost += (1000.0 / edge['bandwidth'])
-            
-        # Toplam Ağırlıklı Maliyet
-        cost = (W_DELAY * delay) + (W_RELIABILITY * rel_cost) + (W_RESOURCE * res_cost)
-        return cost
+        """Tek bir adımın (linkin) ağırlıklı maliyetini döndürür (önceden hesaplanmış tablodan)."""
+        return self.step_costs[self.csr.slot_of(u, v)]
 
-    def train(self):
+    def train(self, episodes=None, stable_probes=RL_STABLE_PROBES, q_tolerance=RL_Q_TOLERANCE,
+              deadline_ms=None):
         """
         Ajanı eğitir ve Q-Tablosunu doldurur.
+
+        episodes: Bölüm sayısı (None -> RL_EPISODES; önbellekten sıcak
+        başlatıldıysa RL_WARM_EPISODES, 0 ise eğitim atlanır)
+        stable_probes: Açgözlü yol bu kadar ölçüm (x100 bölüm) değişmezse dur (0 -> kapalı)
+        q_tolerance: Yol üzerindeki Q değerlerinin ölçümler arası göreli değişimi
+                     bunun altındaysa dur (0 -> kapalı)
+        deadline_ms: Süre bütçesi (ms); dolduğunda eğitim o bölümün sonunda biter
         
         Döndürür:
             history (list): Her 100 bölümde bir test edilen yolun maliyeti (Grafik için).
+            self.stats: {'episodes', 'steps', 'useful_episodes' (dst'ye ulaşan), 'warm_start',
+                         'stop_reason': 'max_episodes' | 'stable_path' | 'q_tolerance' | 'deadline'}
         """
-        history = []
+        warm, episodes = self._warm_start(episodes)
+        monitor = _ConvergenceMonitor(self, stable_probes, q_tolerance, deadline_ms)
+        stop_reason = 'max_episodes'
+        completed = 0
+        phi = self.potential().tolist() if self.shaping else None
+        q = self.q_table
+        indptr = self.indptr
+        # V(s) = max_a Q(s, a) önbelleği: sadece Q(s, a) değiştiğinde artımlı güncellenir
+        v = self.state_values().tolist()
+        total_steps = 0
+        useful = 0
+        if self.reachable is not None:
+            # Eylem maskesi: yuva başına "komşu dst'ye ulaşabilir" dizisi ve bölüm içi ziyaret kaydı
+            indices = self.csr.indices
+            allowed = self.reachable[indices]
+            visited = np.zeros(self.csr.num_nodes, dtype=bool)
+        else:
+            allowed = None
         
-        for episode in range(RL_EPISODES):
+        for episode in range(episodes):
             state = self.src
             current_path_cost = 0 # Maliyet sıfırla
+            trail = [state]
             
             # Sonsuz döngü koruması
             steps = 0
             while state != self.dst and steps < 50:
-                neighbors = list(self.graph.neighbors(state))
-                if not neighbors: break
+                lo, hi = indptr[state], indptr[state + 1]
+                if lo == hi: break
                 
                 # Epsilon-Greedy Seçim (Keşfet vs Sömür)
-                if random.random() < RL_EPSILON:
-                    action = random.choice(neighbors)
+                if allowed is not None:
+                    visited[state] = True
+                    valid = np.flatnonzero(allowed[lo:hi] & ~visited[indices[lo:hi]])
+                    if not len(valid): break
+                    if random.random() < RL_EPSILON:
+                        k = int(valid[random.randrange(len(valid))])
+                    else:
+                        qs = q[lo:hi][valid]
+                        ties = valid[qs == qs.max()]
+                        k = int(ties[random.randrange(len(ties))])
+                elif random.random() < RL_EPSILON:
+                    k = random.randrange(hi - lo)
                 else:
-                    qs = [self.get_q(state, n) for n in neighbors]
-                    max_q = max(qs) if qs else 0
-                    best_opts = [n for n, q in zip(neighbors, qs) if q == max_q]
-                    action = random.choice(best_opts) if best_opts else random.choice(neighbors)
+                    ties = np.flatnonzero(q[lo:hi] == v[state])
+                    k = int(ties[random.randrange(len(ties))])
+                action = self.adj[state][k]
                 
                 # ÖDÜL MEKANİZMASI (SPARSE REWARD)
-                step_cost = self.calculate_step_cost(state, action)
+                step_cost = self.step_costs[lo + k]
                 current_path_cost += step_cost
                 
                 if action == self.dst:
@@ -84,31 +407,197 @@ class QLearningSolver:
                 else:
                     # Ara adımlarda ödül yok (veya küçük ceza)
                     reward = -0.1
+                if phi:
+                    reward += RL_GAMMA * phi[action] - phi[state]
                 
                 # Bellman Denklemi ile Güncelleme
-                old_q = self.get_q(state, action)
+                old_q = q[lo + k]
                 
-                next_neighbors = list(self.graph.neighbors(action))
-                next_max = 0
-                if next_neighbors:
-                    next_max = max([self.get_q(action, n) for n in next_neighbors])
+                # Max_future = V(action); komşu taraması gerekmez
+                next_max = v[action]
                 
                 # Q_new = Q_old + alpha * (Reward + gamma * Max_future - Q_old)
                 new_q = old_q + RL_ALPHA * (reward + RL_GAMMA * next_max - old_q)
-                self.q_table[(state, action)] = new_q
+                q[lo + k] = new_q
+                
+                # V(state) güncellemesi: yeni değer en büyükse doğrudan, en büyük
+                # değer azaldıysa sadece bu durumun dilimi yeniden taranır
+                if new_q >= v[state]:
+                    v[state] = new_q
+                elif old_q == v[state]:
+                    v[state] = q[lo:hi].max()
                 
                 state = action
+                trail.append(state)
                 steps += 1
+
+            if allowed is not None:
+                visited[trail] = False
+            total_steps += steps
+            useful += state == self.dst
+            completed += 1
             
             # İlerleme Kaydı (Her 100 bölümde bir o anki bilgisiyle yol bulup maliyetine bak)
             if episode % 100 == 0:
-                test_path = self.get_path()
-                cost_data = self.model.calculate_cost(test_path)
-                cost = cost_data['score']
-                # Sonsuz maliyetleri grafikte göstermemek için filtreleyebiliriz veya max değer verebiliriz
-                history.append(cost if cost != float('inf') else 0)
+                reason = monitor.probe()
+            else:
+                reason = 'deadline' if monitor.expired() else None
+            if reason:
+                stop_reason = reason
+                break
+
+        return self._finish(monitor, {'episodes': completed, 'steps': total_steps,
+                                      'useful_episodes': useful, 'warm_start': warm,
+                                      'stop_reason': stop_reason})
+
+    def _state_slots(self, states):
+        """
+        Verilen durumların (tekrarlı olabilir) tüm eylem yuvalarını düz dizi
+        olarak döndürür: (segment, offset, slots). segment[i], i. yuvanın
+        hangi duruma ait olduğu; offset, durumun dilimi içindeki sırasıdır.
+        """
+        indptr = self.csr.indptr
+        degrees = indptr[states + 1] - indptr[states]
+        segment = np.repeat(np.arange(len(states)), degrees)
+        starts = np.cumsum(degrees) - degrees
+        offset = np.arange(degrees.sum()) - starts[segment]
+        return segment, offset, indptr[states][segment] + offset
+
+    def train_batched(self, batch_size=RL_BATCH_SIZE, episodes=None, stable_probes=RL_STABLE_PROBES,
+                      q_tolerance=RL_Q_TOLERANCE, deadline_ms=None):
+        """
+        Toplu (batched) eğitim: batch_size ajan aynı anda, adım adım (lockstep)
+        ilerler; eylem seçimi, ödül ve Q güncellemesi B durum üzerinde dizi
+        işlemleriyle yapılır. Toplam bölüm sayısı train() ile aynıdır (episodes);
+        biten ajan, bölüm kaldıkça src'den yeni bölüme başlar.
+
+        Çakışma kuralı: Aynı adımda birden çok ajan aynı Q(s, a) değerini
+        güncellerse hedefleri (reward + gamma * V) ortalanır ve tek bir
+        güncelleme uygulanır: Q += alpha * (ortalama_hedef - Q). Tüm ajanlar
+        adım başındaki V değerlerini görür (senkron güncelleme).
+
+        Rastgelelik random modülünden türetilen bir NumPy üreteciyle sağlanır
+        (random.seed ile tekrarlanabilir).
+
+        Erken durdurma parametreleri ve dönüş değeri train() ile aynıdır.
+        Eylem maskesi (action_mask) bu modda desteklenmez.
+        """
+        if self.reachable is not None:
+            raise ValueError("Eylem maskesi toplu (batched) eğitimde desteklenmez; train() kullanın")
+        warm, episodes = self._warm_start(episodes)
+        monitor = _ConvergenceMonitor(self, stable_probes, q_tolerance, deadline_ms)
+        stop_reason = 'max_episodes'
+        phi = self.potential() if self.shaping else None
+        rng = np.random.default_rng(random.getrandbits(64))
+        q = self.q_table
+        v = self.state_values()
+        indptr = self.csr.indptr
+        degree = np.diff(indptr)
+        indices = self.csr.indices
+        slot_src = self.csr.slot_src
+        step_costs = np.asarray(self.step_costs)
+
+        n_agents = max(0, min(batch_size, episodes))
+        state = np.full(n_agents, self.src)
+        cost = np.zeros(n_agents)
+        steps = np.zeros(n_agents, dtype=np.int64)
+        active = np.ones(n_agents, dtype=bool)
+        started = n_agents
+        completed = 0
+        useful = 0
+        total_steps = 0
+        next_probe = 1  # train() ile aynı: 1., 101., 201., ... bölümlerden sonra
+
+        while active.any():
+            # Çıkmaz sokaktaki ajanların bölümü biter (adım atmadan)
+            movable = active & (state != self.dst)
+            stuck = movable & (degree[state] == 0)
+            if stuck.any():
+                steps[stuck] = 50
+                movable &= ~stuck
+            agents = np.flatnonzero(movable)
+
+            if len(agents):
+                s = state[agents]
+                degrees = degree[s]
+
+                # Epsilon-Greedy Seçim (Keşfet vs Sömür)
+                k = (rng.random(len(agents)) * degrees).astype(np.int64)
+                greedy = np.flatnonzero(rng.random(len(agents)) >= RL_EPSILON)
+                if len(greedy):
+                    # Eşit en iyi değerler arasından rastgele: eşitlere rastgele anahtar,
+                    # diğerlerine -1 verilir ve segment başına en büyük anahtar seçilir
+                    segment, offset, slots = self._state_slots(s[greedy])
+                    key = np.where(q[slots] == v[s[greedy]][segment],
+                                   rng.random(len(slots)), -1.0)
+                    starts = np.cumsum(degrees[greedy]) - degrees[greedy]
+                    best = np.maximum.reduceat(key, starts)
+                    k[greedy] = offset[np.flatnonzero(key == best[segment])]
+
+                slot = indptr[s] + k
+                action = indices[slot]
+
+                # Ödül (train() ile aynı sparse reward)
+                c = cost[agents] + step_costs[slot]
+                cost[agents] = c
+                reward = np.full(len(agents), -0.1)
+                at_dst = action == self.dst
+                goal_cost = c[at_dst]
+                reward[at_dst] = 1000.0 / np.where(goal_cost > 0, goal_cost, 1.0)
+                if phi is not None:
+                    reward += RL_GAMMA * phi[action] - phi[s]
+                target = reward + RL_GAMMA * v[action]
+
+                # Çakışan güncellemeler: aynı yuva için hedeflerin ortalaması
+                unique_slots, inverse = np.unique(slot, return_inverse=True)
+                if len(unique_slots) < len(slot):
+                    target = np.bincount(inverse, target) / np.bincount(inverse)
+                old = q[unique_slots]
+                new = old + RL_ALPHA * (target - old)
+                q[unique_slots] = new
+
+                # V(s) güncellemesi (train() ile aynı kural, vektörel): en büyük değeri
+                # azalan durumlar dilimleri taranarak, diğerleri maximum ile yenilenir
+                owners = slot_src[unique_slots]
+                lost_max = (old == v[owners]) & (new < old)
+                np.maximum.at(v, owners, new)
+                if lost_max.any():
+                    rescan = np.unique(owners[lost_max])
+                    _, _, slots = self._state_slots(rescan)
+                    v[rescan] = np.maximum.reduceat(q[slots], np.cumsum(degree[rescan]) - degree[rescan])
+
+                state[agents] = action
+                steps[agents] += 1
+                total_steps += len(agents)
+
+            # Biten bölümler: hedefe ulaşan, çıkmaza giren veya 50 adımı dolduran ajanlar;
+            # bölüm kaldıkça src'den yeniden başlarlar
+            done = np.flatnonzero(active & ((state == self.dst) | (steps >= 50)))
+            if len(done):
+                completed += len(done)
+                useful += int((state[done] == self.dst).sum())
+                restart = done[:max(0, episodes - started)]
+                active[done[len(restart):]] = False
+                started += len(restart)
+                state[restart] = self.src
+                cost[restart] = 0
+                steps[restart] = 0
+
+            # İlerleme Kaydı (her 100 bölümde bir o anki bilgisiyle yol bulup maliyetine bak)
+            reason = None
+            while completed >= next_probe and not reason:
+                reason = monitor.probe()
+                next_probe += 100
+            if not reason and monitor.expired():
+                reason = 'deadline'
+            if reason:
+                stop_reason = reason
+                break
 
-        return history
+        return self._finish(monitor, {'episodes': completed, 'steps': total_steps,
+                                      'useful_episodes': useful, 'batch_size': n_agents,
+                                      'warm_start': warm,
+                                      'stop_reason': stop_reason})
 
     def get_path(self):
         """
@@ -120,11 +609,14 @@ class QLearningSolver:
         
         steps = 0
         while state != self.dst and steps < 100:
-            neighbors = [n for n in self.graph.neighbors(state) if n not in visited]
-            if not neighbors: break
+            lo, hi = self.indptr[state], self.indptr[state + 1]
+            candidates = [(n, q) for n, q in zip(self.adj[state], self.q_table[lo:hi].tolist())
+                          if n not in visited and (self.reachable is None or self.reachable[n])]
+            if not candidates: break
+            neighbors = [n for n, _ in candidates]
             
             # Öğrenilmiş Q değerlerine göre en iyiyi seç (Exploration kapalı)
-            qs = [self.get_q(state, n) for n in neighbors]
+            qs = [q for _, q in candidates]
             if not qs: break
             
             best_idx = qs.index(max(qs))
@@ -0,0 +1,227 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.network_model import CostProfile
+from src.dijkstra_solver import shortest_path_tree
+
+# Worker süreçlerinin paylaştığı iş tanımları: job_id -> (csr, edge_costs, node_costs)
+_JOBS = None
+
+
+def _init_worker(jobs):
+    """Worker başlangıcı: topoloji/maliyet dizileri süreç başına bir kez alınır."""
+    global _JOBS
+    _JOBS = jobs
+
+
+def _solve_sources(job_id, sources, dtype):
+    """Verilen kaynak düğümler için ön-düğüm (predecessor) satırlarını hesaplar."""
+    csr, edge_costs, node_costs = _JOBS[job_id]
+    rows = np.empty((len(sources), csr.num_nodes), dtype=dtype)
+    for i, s in enumerate(sources):
+        _, parent = shortest_path_tree(csr, edge_costs, node_costs, s)
+        rows[i] = parent
+    return job_id, sources, rows
+
+
+class RouteTable:
+    """
+    Tüm (kaynak, hedef) çiftleri için önceden hesaplanmış optimal rotalar.
+
+    Her (ağırlık profili, BW sınıfı) için n x n'lik bir ön-düğüm matrisi
+    tutulur: pred[s][v], s kökenli en kısa yol ağacında v'nin ebeveynidir.
+    Sorgular hiçbir çözücü çalıştırmadan, matristen yol geri izlenerek
+    O(yol uzunluğu) sürede cevaplanır.
+
+    BW sınıfı seçimi: talep edilen min_bw için, ondan küçük olmayan en küçük
+    sınıf kullanılır (tam eşleşmede optimum, aksi halde daha sıkı filtreyle
+    uygun/feasible bir rota).
+    """
+    def __init__(self, model, predecessors):
+        self.model = model
+        # (CostProfile, bw_class) -> ön-düğüm matrisi (aynı filtreyi veren sınıflar
+        # aynı matris nesnesini paylaşır)
+        self.predecessors = predecessors
+        # Topoloji güncellemesinden etkilenen (yeniden hesaplanacak) kaynaklar
+        self.stale = {key: np.zeros(len(pred), dtype=bool)
+                      for key, pred in predecessors.items()}
+
+    @classmethod
+    def build(cls, model, bw_classes=(0,), profiles=None, workers=None, chunk_size=16):
+        """
+        Rota tablosunu oluşturur.
+
+        bw_classes: BW sınıfları (Mbps)
+        profiles: CostProfile listesi (None -> sadece varsayılan profil)
+        workers: Süreç sayısı (None -> CPU sayısı, 1 -> aynı süreçte seri)
+        """
+        profiles = [CostProfile.of(p) for p in (profiles or [None])]
+        n = model.get_csr().num_nodes
+        dtype = np.int16 if n <= np.iinfo(np.int16).max else np.int32
+
+        # Aynı kenar kümesini veren BW sınıfları tek bir iş olarak hesaplanır
+        jobs, job_keys = [], {}
+        for profile in profiles:
+            table = model.get_cost_table(profile)
+            for bw in bw_classes:
+                job = (profile, model._bandwidth_cut(bw))
+                if job not in job_keys:
+                    csr = model.get_csr(bw)
+                    job_keys[job] = len(jobs)
+                    jobs.append((csr, table.edge[csr.edge_ids].tolist(), table.node.tolist()))
+
+        matrices = [np.full((n, n), -1, dtype=dtype) for _ in jobs]
+        tasks = [(job_id, list(range(start, min(start + chunk_size, n))))
+                 for job_id in range(len(jobs)) for start in range(0, n, chunk_size)]
+
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            _init_worker(jobs)
+            results = (_solve_sources(job_id, sources, dtype) for job_id, sources in tasks)
+            for job_id, sources, rows in results:
+                matrices[job_id][sources] = rows
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(jobs,)) as pool:
+                futures = [pool.submit(_solve_sources, job_id, sources, dtype)
+                           for job_id, sources in tasks]
+                for future in futures:
+                    job_id, sources, rows = future.result()
+                    matrices[job_id][sources] = rows
+
+        predecessors = {}
+        for profile in profiles:
+            for bw in bw_classes:
+                job_id = job_keys[(profile, model._bandwidth_cut(bw))]
+                predecessors[(profile, float(bw))] = matrices[job_id]
+        return cls(model, predecessors)
+
+    @property
+    def bw_classes(self):
+        return sorted({bw for _, bw in self.predecessors})
+
+    @property
+    def profiles(self):
+        return sorted({p for p, _ in self.predecessors})
+
+    @property
+    def nbytes(self):
+        """Tablonun bellek kullanımı (byte; paylaşılan matrisler bir kez sayılır)."""
+        unique = {id(m): m for m in self.predecessors.values()}
+        return sum(m.nbytes for m in unique.values())
+
+    def _key(self, min_bw, profile):
+        """Sorgu için (profil, BW sınıfı) anahtarı; uygun sınıf yoksa None."""
+        profile = CostProfile.of(profile)
+        classes = [bw for p, bw in self.predecessors if p == profile and bw >= min_bw]
+        if not classes:
+            return None
+        return profile, min(classes)
+
+    def lookup(self, src, dst, min_bw=0, profile=None):
+        """
+        (src, dst, min_bw) sorgusunu tablodan cevaplar.
+
+        Dönüş: Yol (liste) veya rota/uygun sınıf yoksa None
+        """
+        key = self._key(min_bw, profile)
+        if key is None:
+            return None
+        if self.stale[key][src]:
+            self._refresh_source(key, src)
+
+        row = self.predecessors[key][src]
+        path = [dst]
+        while path[-1] != src:
+            prev = int(row[path[-1]])
+            if prev < 0 or len(path) > len(row):
+                return None
+            path.append(prev)
+        return path[::-1]
+
+    def _refresh_source(self, key, src):
+        """Güncellemeden etkilenmiş tek bir kaynak satırını yeniden hesaplar."""
+        profile, bw = key
+        csr = self.model.get_csr(bw)
+        table = self.model.get_cost_table(profile)
+        _, parent = shortest_path_tree(csr, table.edge[csr.edge_ids].tolist(),
+                                       table.node.tolist(), src)
+        self.predecessors[key][src] = parent
+        self.stale[key][src] = False
+
+    def mark_stale(self, key, edge=None, node=None):
+        """
+        Topoloji güncellemesinden etkilenebilecek kaynak satırlarını eskitir
+        (bir sonraki sorguda yeniden hesaplanırlar).
+
+        edge=(u, v): Sadece en kısa yol ağacı bu linki kullanan kaynaklar
+        node=x:      Sadece ağacında x'i ara düğüm olarak kullanan kaynaklar
+        İkisi de yoksa: tüm kaynaklar (ör. maliyet azaldıysa herkes etkilenebilir)
+        """
+        pred = self.predecessors[key]
+        # Paylaşılan matris artık diğer sınıflardan ayrışıyor; kopyala
+        if any(m is pred for k, m in self.predecessors.items() if k != key):
+            pred = self.predecessors[key] = pred.copy()
+
+        if edge is not None:
+            u, v = edge
+            rows = (pred[:, v] == u) | (pred[:, u] == v)
+        elif node is not None:
+            rows = (pred == node).any(axis=1)
+        else:
+            rows = np.ones(len(pred), dtype=bool)
+        self.stale[key] |= rows
+
+    @staticmethod
+    def _fingerprint(model):
+        """Modelin topoloji parmak izi: CSV anahtarı, düğüm/aktif link sayısı, sürüm."""
+        return {'source_key': str(model.source_key or ''),
+                'num_nodes': len(model.node_ids),
+                'num_edges': int(model.edge_active.sum()),
+                'topology_version': model.topology_version}
+
+    def save(self, file):
+        """
+        Tabloyu (sıkıştırılmış) .npz dosyasına yazar; paylaşılan matrisler bir kez yazılır.
+        Yükleme sırasında doğrulanmak üzere topolojinin parmak izi de yazılır.
+        """
+        keys = list(self.predecessors)
+        unique = []
+        matrix_index = []
+        for k in keys:
+            pred = self.predecessors[k]
+            idx = next((i for i, m in enumerate(unique) if m is pred), None)
+            if idx is None:
+                idx = len(unique)
+                unique.append(pred)
+            matrix_index.append(idx)
+
+        np.savez_compressed(
+            file,
+            profiles=np.array([list(p) for p, _ in keys]),
+            bw_classes=np.array([bw for _, bw in keys]),
+            matrix_index=np.array(matrix_index),
+            **self._fingerprint(self.model),
+            **{f'pred_{i}': m for i, m in enumerate(unique)})
+
+    @classmethod
+    def load(cls, model, file):
+        """
+        save() ile yazılmış tabloyu okur. Parmak izi (CSV anahtarı, düğüm/link
+        sayısı, topoloji sürümü) modelinkiyle uyuşmuyorsa ya da hiç yoksa
+        ValueError fırlatır.
+        """
+        with np.load(file, allow_pickle=False) as data:
+            expected = cls._fingerprint(model)
+            for name, value in expected.items():
+                if name not in data.files or data[name].item() != value:
+                    raise ValueError(f"Rota tablosu bu topolojiyle uyumsuz ({name}): {file}")
+            matrices = {}
+            predecessors = {}
+            for weights, bw, idx in zip(data['profiles'], data['bw_classes'], data['matrix_index']):
+                if idx not in matrices:
+                    matrices[idx] = data[f'pred_{idx}']
+                predecessors[(CostProfile(*weights), float(bw))] = matrices[idx]
+        return cls(model, predecessors)
@@ -1,8 +1,12 @@
+import argparse
 import pandas as pd
+import random
 import time
 import numpy as np
 import sys
 import os
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Proje kök dizinini path'e ekle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,72 +14,153 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.config import NODE_FILE, EDGE_FILE, DEMAND_FILE
 from src.network_model import NetworkModel
 from src.ga_solver import GeneticSolver
-from src.rl_solver import QLearningSolver
+from src.rl_solver import QLearningSolver, QTableCache
+from src.dijkstra_solver import DijkstraSolver
 
 # DENEY AYARLARI
 REPEAT_COUNT = 5  # PDF Madde 6: En az 5 tekrar 
+GA_DEADLINE_MS = None  # GA süre bütçesi (ms); None -> sadece nesil/durgunluk sınırı
+RL_DEADLINE_MS = None  # RL eğitim süre bütçesi (ms); None -> sadece bölüm/yakınsama sınırı
+RL_Q_CACHE = False  # True -> RL tekrarları önceki eğitimin Q-Tablosunu devralır (tekrarlar bağımsız olmaz;
+                    # paralel modda önbellek worker başınadır, isabetler görev dağılımına bağlıdır)
+EXPERIMENT_WORKERS = 1  # Süreç sayısı (1 -> aynı süreçte seri, None -> CPU sayısı)
+EXPERIMENT_SEED = 2025  # Görev tohumları bu kökten SeedSequence ile türetilir
 
-def run_experiments():
-    print(f"=== DENEY BAŞLIYOR ({REPEAT_COUNT} Tekrar) ===")
+# Worker süreç durumu: model (ve opsiyonel Q önbelleği) süreç başına bir kez yüklenir
+_NETWORK = None
+_Q_CACHE = None
+
+
+def _init_worker(network=None):
+    """Worker başlangıcı: ağ modeli süreç başına bir kez (npz önbelleğinden) yüklenir."""
+    global _NETWORK, _Q_CACHE
+    _NETWORK = network or NetworkModel(NODE_FILE, EDGE_FILE)
+    _Q_CACHE = QTableCache() if RL_Q_CACHE else None
+
+
+def _run_task(task):
+    """
+    Tek bir (talep, algoritma, tekrar) çalıştırması.
+
+    task: (demand_id, algo, repeat, src, dst, bw_demand, seed)
+    Dönüş: (demand_id, algo, repeat, kayıt sözlüğü)
+    """
+    idx, algo, repeat, src, dst, bw_demand, seed = task
+    # Görev başına bağımsız ve tekrarlanabilir tohum (worker/sıra bağımsız)
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    network = _NETWORK
+
+    start_time = time.time()
+    if algo == 'GA':
+        solver = GeneticSolver(network, src, dst, min_bw=bw_demand)
+        path, cost, _, _ = solver.solve(deadline_ms=GA_DEADLINE_MS)
+        duration = (time.time() - start_time) * 1000 # ms cinsinden
+        metrics = network.calculate_metrics(path)
+        record = {'cost': cost,
+                  'generations': solver.stats['generations'],
+                  'init_rate': solver.stats.get('init_success_rate', 0.0)}
+    else:
+        solver = QLearningSolver(network, src, dst, min_bw=bw_demand, q_cache=_Q_CACHE)
+        solver.train(deadline_ms=RL_DEADLINE_MS)
+        path = solver.get_path() # Yolu bul
+        metrics = network.calculate_metrics(path)
+        duration = (time.time() - start_time) * 1000 # ms cinsinden
+        record = {'cost': metrics['cost'] if metrics else float('inf'),
+                  'episodes': solver.stats['episodes'],
+                  'warm_start': solver.stats['warm_start']}
+
+    # Detaylı metrikler
+    record.update(time=duration,
+                  delay=metrics['delay'] if metrics else 0,
+                  reliability=metrics['reliability'] if metrics else 0,
+                  stop_reason=solver.stats['stop_reason'])
+    return idx, algo, repeat, record
+
+
+def _reasons(records):
+    counts = Counter(r['stop_reason'] for r in records)
+    return ", ".join(f"{r}:{n}" for r, n in counts.most_common())
+
+
+def run_experiments(workers=EXPERIMENT_WORKERS, seed=EXPERIMENT_SEED, excel_file="Proje_Sonuclari.xlsx"):
+    """
+    Tüm talepleri GA ve RL ile REPEAT_COUNT kez çözer, Dijkstra optimumuyla
+    karşılaştırıp sonuçları Excel'e yazar.
+
+    (talep, algoritma, tekrar) görevleri workers > 1 ise süreç havuzuna
+    dağıtılır; her worker ağ modelini bir kez yükler. Görev tohumları
+    sabit sırayla SeedSequence(seed).spawn ile türetildiği için sonuçlar
+    worker sayısından bağımsızdır (süreler hariç).
+
+    Dönüş: Duvar süresi (s; görevlerin çalıştırılması)
+    """
+    workers = workers or os.cpu_count() or 1
+    print(f"=== DENEY BAŞLIYOR ({REPEAT_COUNT} Tekrar, {workers} Worker) ===")
     
     # 1. Modeli Yükle
     network = NetworkModel(NODE_FILE, EDGE_FILE)
     demands = pd.read_csv(DEMAND_FILE, delimiter=';')
-    
-    results = []
+    demand_info = {idx: (int(row['src']), int(row['dst']), int(row['bw_demand']))
+                   for idx, row in demands.iterrows()}
 
-    # 2. Her talep için döngü
-    total_demands = len(demands)
-    for idx, row in demands.iterrows():
+    # 2. Görevler: her talep için GA ve RL tekrarları (sabit sıra -> sabit tohumlar)
+    tasks = [(idx, algo, repeat) + demand_info[idx]
+             for idx in demand_info for algo in ('GA', 'RL') for repeat in range(REPEAT_COUNT)]
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    tasks = [task + (int(s.generate_state(1)[0]),) for task, s in zip(tasks, seeds)]
 
-        src, dst = int(row['src']), int(row['dst'])
-        bw_demand = int(row['bw_demand'])
-        print(f"[{idx+1}/{total_demands}] Talep İşleniyor: {src} -> {dst} (BW: {bw_demand} Mbps) ...")
+    records = defaultdict(dict)  # (demand_id, algo) -> {repeat: kayıt}
+    remaining = Counter(idx for idx, *_ in tasks)
+    total_demands = len(demand_info)
 
-        # --- GENETİK ALGORİTMA (GA) ---
-        ga_costs = []
-        ga_times = []
-        ga_delays = []
-        ga_reliabilities = []
-        
-        for _ in range(REPEAT_COUNT):
-            start_time = time.time()
-            solver = GeneticSolver(network, src, dst, min_bw=bw_demand)
-            ga_path, cost, _, _ = solver.solve()
-            duration = (time.time() - start_time) * 1000 # ms cinsinden
-            
-            # Detaylı metrikleri hesapla
-            metrics = network.calculate_metrics(ga_path)
-            
-            ga_costs.append(cost)
-            ga_times.append(duration)
-            ga_delays.append(metrics['delay'] if metrics else 0)
-            ga_reliabilities.append(metrics['reliability'] if metrics else 0)
-
-        # --- Q-LEARNING (RL) ---
-        rl_costs = []
-        rl_times = []
-        rl_delays = []
-        rl_reliabilities = []
-        
-        for _ in range(REPEAT_COUNT):
-            start_time = time.time()
-            solver = QLearningSolver(network, src, dst, min_bw=bw_demand)
-            solver.train() 
-            path = solver.get_path() # Yolu bul
-            
-            # Detaylı metrikleri hesapla
-            metrics = network.calculate_metrics(path)
-            cost = metrics['cost'] if metrics else float('inf')
-            
-            duration = (time.time() - start_time) * 1000 # ms cinsinden
-            
-            rl_costs.append(cost)
-            rl_times.append(duration)
-            rl_delays.append(metrics['delay'] if metrics else 0)
-            rl_reliabilities.append(metrics['reliability'] if metrics else 0)
+    def collect(result):
+        idx, algo, repeat, record = result
+        records[(idx, algo)][repeat] = record
+        remaining[idx] -= 1
+        if not remaining[idx]:
+            src, dst, bw_demand = demand_info[idx]
+            done = sum(1 for n in remaining.values() if n == 0)
+            print(f"[{done}/{total_demands}] Talep Tamamlandı: {src} -> {dst} (BW: {bw_demand} Mbps)")
+
+    wall_start = time.time()
+    if workers <= 1:
+        _init_worker(network)
+        for task in tasks:
+            collect(_run_task(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_run_task, task) for task in tasks]
+            for future in as_completed(futures):
+                collect(future.result())
+    wall_time = time.time() - wall_start
+
+    # Eşzamanlılık = görev süreleri toplamı / duvar süresi. Çekirdek sayısından fazla
+    # worker'da görev süreleri de uzadığı için gerçek hızlanma değildir; seri
+    # çalıştırmaya göre hızlanma için: python src/benchmarks.py experiments
+    task_time = sum(r['time'] for runs in records.values() for r in runs.values()) / 1000
+    print(f"\n Duvar süresi: {wall_time:.1f} s | Görev sürelerinin toplamı: {task_time:.1f} s | "
+          f"Eşzamanlılık: {task_time / wall_time:.2f}x ({workers} worker)")
 
+    results = []
+    for idx, (src, dst, bw_demand) in demand_info.items():
+        ga = [records[(idx, 'GA')][r] for r in range(REPEAT_COUNT)]
+        rl = [records[(idx, 'RL')][r] for r in range(REPEAT_COUNT)]
+        ga_costs = [r['cost'] for r in ga]
+        rl_costs = [r['cost'] for r in rl]
         
+        # --- DIJKSTRA (Referans / Kesin Optimum) ---
+        # Deterministik olduğundan tek çalıştırma yeterlidir.
+        start_time = time.time()
+        _, dj_cost = DijkstraSolver(network, src, dst, min_bw=bw_demand).solve()
+        dj_time = (time.time() - start_time) * 1000 # ms cinsinden
+
+        def optimality_gap(costs):
+            """Ortalama maliyetin optimuma göre yüzde sapması."""
+            if dj_cost in (0, float('inf')):
+                return float('nan')
+            return (np.mean(costs) - dj_cost) / dj_cost * 100
+
         # İstatistikleri Kaydet
         results.append({
             "Demand ID": idx,
@@ -84,17 +169,28 @@ def run_experiments():
             # GA Sonuçları
             "GA_Best_Cost": np.min(ga_costs),
             "GA_Avg_Cost": np.mean(ga_costs),
-            "GA_Avg_Delay_ms": np.mean(ga_delays),
-            "GA_Avg_Reliability": np.mean(ga_reliabilities),
+            "GA_Avg_Delay_ms": np.mean([r['delay'] for r in ga]),
+            "GA_Avg_Reliability": np.mean([r['reliability'] for r in ga]),
             "GA_Std_Dev": np.std(ga_costs),
-            "GA_Avg_Time_ms": np.mean(ga_times),
+            "GA_Avg_Time_ms": np.mean([r['time'] for r in ga]),
+            "GA_Avg_Generations": np.mean([r['generations'] for r in ga]),
+            "GA_Init_Success_%": np.mean([r['init_rate'] for r in ga]) * 100,
+            "GA_Stop_Reasons": _reasons(ga),
             # RL Sonuçları
             "RL_Best_Cost": np.min(rl_costs),
             "RL_Avg_Cost": np.mean(rl_costs),
-            "RL_Avg_Delay_ms": np.mean(rl_delays),
-            "RL_Avg_Reliability": np.mean(rl_reliabilities),
+            "RL_Avg_Delay_ms": np.mean([r['delay'] for r in rl]),
+            "RL_Avg_Reliability": np.mean([r['reliability'] for r in rl]),
             "RL_Std_Dev": np.std(rl_costs),
-            "RL_Avg_Time_ms": np.mean(rl_times),
+            "RL_Avg_Time_ms": np.mean([r['time'] for r in rl]),
+            "RL_Avg_Episodes": np.mean([r['episodes'] for r in rl]),
+            "RL_Stop_Reasons": _reasons(rl),
+            "RL_Warm_Starts": sum(r['warm_start'] for r in rl),
+            # Referans (Dijkstra) ve Optimallik Farkı
+            "DJ_Cost": dj_cost,
+            "DJ_Time_ms": dj_time,
+            "GA_Gap_%": optimality_gap(ga_costs),
+            "RL_Gap_%": optimality_gap(rl_costs),
             # Kazanan
             "Winner": "GA" if np.mean(ga_costs) < np.mean(rl_costs) else "RL"
         })
@@ -102,12 +198,14 @@ def run_experiments():
     
     # 3. Sonuçları Excel'e Yaz
     df_res = pd.DataFrame(results)
-    excel_file = "Proje_Sonuclari.xlsx"
     
     # Sütun sırasını düzenle
     cols = ["Demand ID", "Source", "Destination", 
             "GA_Best_Cost", "GA_Avg_Cost", "GA_Avg_Delay_ms", "GA_Avg_Reliability", "GA_Avg_Time_ms",
+            "GA_Avg_Generations", "GA_Init_Success_%", "GA_Stop_Reasons",
             "RL_Best_Cost", "RL_Avg_Cost", "RL_Avg_Delay_ms", "RL_Avg_Reliability", "RL_Avg_Time_ms",
+            "RL_Avg_Episodes", "RL_Stop_Reasons", "RL_Warm_Starts",
+            "DJ_Cost", "DJ_Time_ms", "GA_Gap_%", "RL_Gap_%",
             "Winner"]
             
     # Sadece mevcut sütunları seç (hata önlemek için)
@@ -116,7 +214,13 @@ def run_experiments():
     
     df_res.to_excel(excel_file, index=False)
     print(f"\n Tüm deneyler bitti! Sonuçlar '{excel_file}' dosyasına kaydedildi.")
+    return wall_time
 
 
 if __name__ == "__main__":
-    run_experiments()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="BSM307 GA / RL / Dijkstra deneyleri")
+    parser.add_argument('--workers', type=int, default=EXPERIMENT_WORKERS,
+                        help="Süreç sayısı (1 -> seri, 0 -> CPU sayısı)")
+    parser.add_argument('--seed', type=int, default=EXPERIMENT_SEED, help="Kök tohum")
+    args = parser.parse_args()
+    run_experiments(workers=args.workers, seed=args.seed)
\ No newline at end of file